@@ -231,32 +231,19 @@ class ProcessExecutor(QObject):
             # Calculate duration
             duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
 
-            # Update execution history
-            if self.current_execution_id:
-                status = 'completed' if success else 'failed'
-                if self.is_cancelled:
-                    status = 'cancelled'
-
-                self.db.update_execution_history(
-                    self.current_execution_id,
-                    status=status,
-                    completed_steps=self.completed_steps,
-                    failed_steps=self.failed_steps,
-                    duration_ms=duration_ms,
-                    error_message=message if not success else None
-                )
-
-            # Update process statistics
-            conn = self.db.connect()
-            current_use_count = conn.execute(
-                "SELECT use_count FROM processes WHERE id = ?",
-                (process_id,)
-            ).fetchone()[0]
-
-            self.db.update_process(
+            # Update execution history and process statistics (single commit)
+            status = 'completed' if success else 'failed'
+            if self.is_cancelled:
+                status = 'cancelled'
+
+            self.db.complete_execution(
+                self.current_execution_id,
                 process_id,
-                use_count=current_use_count + 1,
-                last_used=datetime.now().isoformat()
+                status=status,
+                completed_steps=self.completed_steps,
+                failed_steps=self.failed_steps,
+                duration_ms=duration_ms,
+                error_message=message if not success else None
             )
 
             # Emit execution completed
@@ -12,12 +12,11 @@ import logging
 import sys
 from pathlib import Path
 from typing import List, Optional, Tuple
-from datetime import datetime
 
 # Add parent directories to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from models.process import Process, ProcessStep
+from models.process import Process, ProcessStep, dump_tags
 from database.db_manager import DBManager
 
 logger = logging.getLogger(__name__)
@@ -62,24 +61,15 @@ class ProcessManager:
                 color=process.color,
                 execution_mode=process.execution_mode,
                 delay_between_steps=process.delay_between_steps,
-                tags=','.join(process.tags) if process.tags else None,
+                tags=dump_tags(process.tags),
                 category=process.category
             )
 
             # Add steps if any
             if process.steps:
-                for step in process.steps:
-                    self.db.add_process_step(
-                        process_id=process_id,
-                        item_id=step.item_id,
-                        step_order=step.step_order,
-                        custom_label=step.custom_label,
-                        is_optional=step.is_optional,
-                        is_enabled=step.is_enabled,
-                        wait_for_confirmation=step.wait_for_confirmation,
-                        notes=step.notes,
-                        group_name=step.group_name
-                    )
+                self.db.add_process_steps_bulk(
+                    [step.to_row(process_id) for step in process.steps]
+                )
 
             logger.info(f"Process created: {process.name} (ID: {process_id}) with {len(process.steps)} steps")
             return True, "Process created successfully", process_id
@@ -106,8 +96,7 @@ class ProcessManager:
                 return None
 
             # Get process steps
-            steps_data = self.db.get_process_steps(process_id)
-            steps = [ProcessStep.from_dict(step_dict) for step_dict in steps_data]
+            steps = [ProcessStep.from_row(row) for row in self.db.get_process_step_rows(process_id)]
 
             # Create Process object
             process = Process.from_dict(process_data, steps=steps)
@@ -143,8 +132,7 @@ class ProcessManager:
                 process_id = process_data['id']
 
                 # Get steps for this process
-                steps_data = self.db.get_process_steps(process_id)
-                steps = [ProcessStep.from_dict(step_dict) for step_dict in steps_data]
+                steps = [ProcessStep.from_row(row) for row in self.db.get_process_step_rows(process_id)]
 
                 # Create Process object
                 process = Process.from_dict(process_data, steps=steps)
@@ -185,12 +173,12 @@ class ProcessManager:
                 color=process.color,
                 execution_mode=process.execution_mode,
                 delay_between_steps=process.delay_between_steps,
-                auto_copy_results=int(process.auto_copy_results),
-                is_pinned=int(process.is_pinned),
+                auto_copy_results=process.auto_copy_results,
+                is_pinned=process.is_pinned,
                 pinned_order=process.pinned_order,
-                is_active=int(process.is_active),
-                is_archived=int(process.is_archived),
-                tags=','.join(process.tags) if process.tags else None,
+                is_active=process.is_active,
+                is_archived=process.is_archived,
+                tags=dump_tags(process.tags),
                 category=process.category
             )
 
@@ -200,18 +188,9 @@ class ProcessManager:
 
             # Then add the new steps
             if process.steps:
-                for step in process.steps:
-                    self.db.add_process_step(
-                        process_id=process.id,
-                        item_id=step.item_id,
-                        step_order=step.step_order,
-                        custom_label=step.custom_label,
-                        is_optional=step.is_optional,
-                        is_enabled=step.is_enabled,
-                        wait_for_confirmation=step.wait_for_confirmation,
-                        notes=step.notes,
-                        group_name=step.group_name
-                    )
+                self.db.add_process_steps_bulk(
+                    [step.to_row(process.id) for step in process.steps]
+                )
 
             logger.info(f"Process {process.id} updated: {process.name} with {len(process.steps)} steps")
             return True, "Process updated successfully"
@@ -362,26 +341,26 @@ class ProcessManager:
 
     # ==================== SEARCH AND FILTER ====================
 
-    def search_processes(self, query: str) -> List[Process]:
+    def search_processes(self, query: str, prefix_only: bool = False) -> List[Process]:
         """
         Search processes by name, description, or tags
 
         Args:
             query: Search query
+            prefix_only: Only match process names starting with query
 
         Returns:
             List of matching Process objects
         """
         try:
-            processes_data = self.db.search_processes(query)
+            processes_data = self.db.search_processes(query, prefix_only=prefix_only)
 
             processes = []
             for process_data in processes_data:
                 process_id = process_data['id']
 
                 # Get steps
-                steps_data = self.db.get_process_steps(process_id)
-                steps = [ProcessStep.from_dict(step_dict) for step_dict in steps_data]
+                steps = [ProcessStep.from_row(row) for row in self.db.get_process_step_rows(process_id)]
 
                 # Create Process object
                 process = Process.from_dict(process_data, steps=steps)
@@ -409,8 +388,7 @@ class ProcessManager:
                 process_id = process_data['id']
 
                 # Get steps
-                steps_data = self.db.get_process_steps(process_id)
-                steps = [ProcessStep.from_dict(step_dict) for step_dict in steps_data]
+                steps = [ProcessStep.from_row(row) for row in self.db.get_process_step_rows(process_id)]
 
                 # Create Process object
                 process = Process.from_dict(process_data, steps=steps)
@@ -471,14 +449,8 @@ class ProcessManager:
             Success status
         """
         try:
-            self.db.update_process(
-                process_id,
-                use_count=self.db.connect().execute(
-                    "SELECT use_count FROM processes WHERE id = ?",
-                    (process_id,)
-                ).fetchone()[0] + 1,
-                last_used=datetime.now().isoformat()
-            )
+            # UPDATE atómico (use_count = use_count + 1): sin leer y reescribir el valor
+            self.db.increment_process_use_count(process_id)
 
             logger.debug(f"Incremented use count for process {process_id}")
             return True
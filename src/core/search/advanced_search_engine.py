@@ -251,9 +251,6 @@ class AdvancedSearchEngine:
         """
         start_time = time.time()
 
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
         # Build WHERE clauses
         where_clauses = ["i.is_active = 1"]
         params = []
@@ -319,29 +316,30 @@ class AdvancedSearchEngine:
         where_sql = " AND ".join(where_clauses)
 
         try:
-            results = cursor.execute(f"""
-                SELECT
-                    i.id,
-                    i.category_id,
-                    i.label,
-                    i.content,
-                    i.type,
-                    i.tags,
-                    i.description,
-                    i.is_favorite,
-                    i.is_sensitive,
-                    i.use_count,
-                    i.last_used,
-                    i.created_at,
-                    c.name as category_name,
-                    c.icon as category_icon,
-                    0 as rank_score
-                FROM items i
-                LEFT JOIN categories c ON i.category_id = c.id
-                WHERE {where_sql}
-                ORDER BY i.use_count DESC, i.last_used DESC
-                LIMIT ? OFFSET ?
-            """, params + [limit, offset]).fetchall()
+            with self.db.read_connection() as conn:
+                results = conn.execute(f"""
+                    SELECT
+                        i.id,
+                        i.category_id,
+                        i.label,
+                        i.content,
+                        i.type,
+                        i.tags,
+                        i.description,
+                        i.is_favorite,
+                        i.is_sensitive,
+                        i.use_count,
+                        i.last_used,
+                        i.created_at,
+                        c.name as category_name,
+                        c.icon as category_icon,
+                        0 as rank_score
+                    FROM items i
+                    LEFT JOIN categories c ON i.category_id = c.id
+                    WHERE {where_sql}
+                    ORDER BY i.use_count DESC, i.last_used DESC
+                    LIMIT ? OFFSET ?
+                """, params + [limit, offset]).fetchall()
 
             execution_time = (time.time() - start_time) * 1000
 
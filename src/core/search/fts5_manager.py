@@ -59,36 +59,34 @@ class FTS5Manager:
         """
         start_time = time.time()
 
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
         try:
-            results = cursor.execute("""
-                SELECT
-                    i.id,
-                    i.category_id,
-                    i.label,
-                    i.content,
-                    i.type,
-                    i.tags,
-                    i.description,
-                    i.is_favorite,
-                    i.is_sensitive,
-                    i.use_count,
-                    i.last_used,
-                    i.created_at,
-                    c.name as category_name,
-                    c.icon as category_icon,
-                    c.color as category_color,
-                    bm25(items_fts, 10.0, 5.0, 3.0, 2.0, 1.0) as rank_score
-                FROM items_fts
-                JOIN items i ON items_fts.rowid = i.id
-                LEFT JOIN categories c ON i.category_id = c.id
-                WHERE items_fts MATCH ?
-                  AND i.is_active = 1
-                ORDER BY rank_score
-                LIMIT ? OFFSET ?
-            """, (query, limit, offset)).fetchall()
+            with self.db.read_connection() as conn:
+                results = conn.execute("""
+                    SELECT
+                        i.id,
+                        i.category_id,
+                        i.label,
+                        i.content,
+                        i.type,
+                        i.tags,
+                        i.description,
+                        i.is_favorite,
+                        i.is_sensitive,
+                        i.use_count,
+                        i.last_used,
+                        i.created_at,
+                        c.name as category_name,
+                        c.icon as category_icon,
+                        c.color as category_color,
+                        bm25(items_fts, 10.0, 5.0, 3.0, 2.0, 1.0) as rank_score
+                    FROM items_fts
+                    JOIN items i ON items_fts.rowid = i.id
+                    LEFT JOIN categories c ON i.category_id = c.id
+                    WHERE items_fts MATCH ?
+                      AND i.is_active = 1
+                    ORDER BY rank_score
+                    LIMIT ? OFFSET ?
+                """, (query, limit, offset)).fetchall()
 
             execution_time = (time.time() - start_time) * 1000
 
@@ -180,36 +178,34 @@ class FTS5Manager:
         """
         start_time = time.time()
 
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
         try:
-            results = cursor.execute("""
-                SELECT
-                    i.id,
-                    i.category_id,
-                    i.label,
-                    i.content,
-                    i.type,
-                    i.tags,
-                    i.description,
-                    i.is_favorite,
-                    i.is_sensitive,
-                    i.use_count,
-                    i.last_used,
-                    c.name as category_name,
-                    c.icon as category_icon,
-                    snippet(items_fts, 1, '<mark>', '</mark>', '...', ?) as label_snippet,
-                    snippet(items_fts, 2, '<mark>', '</mark>', '...', ?) as content_snippet,
-                    bm25(items_fts) as rank_score
-                FROM items_fts
-                JOIN items i ON items_fts.rowid = i.id
-                LEFT JOIN categories c ON i.category_id = c.id
-                WHERE items_fts MATCH ?
-                  AND i.is_active = 1
-                ORDER BY rank_score
-                LIMIT ?
-            """, (context_length, context_length, query, limit)).fetchall()
+            with self.db.read_connection() as conn:
+                results = conn.execute("""
+                    SELECT
+                        i.id,
+                        i.category_id,
+                        i.label,
+                        i.content,
+                        i.type,
+                        i.tags,
+                        i.description,
+                        i.is_favorite,
+                        i.is_sensitive,
+                        i.use_count,
+                        i.last_used,
+                        c.name as category_name,
+                        c.icon as category_icon,
+                        snippet(items_fts, 1, '<mark>', '</mark>', '...', ?) as label_snippet,
+                        snippet(items_fts, 2, '<mark>', '</mark>', '...', ?) as content_snippet,
+                        bm25(items_fts) as rank_score
+                    FROM items_fts
+                    JOIN items i ON items_fts.rowid = i.id
+                    LEFT JOIN categories c ON i.category_id = c.id
+                    WHERE items_fts MATCH ?
+                      AND i.is_active = 1
+                    ORDER BY rank_score
+                    LIMIT ?
+                """, (context_length, context_length, query, limit)).fetchall()
 
             execution_time = (time.time() - start_time) * 1000
 
@@ -257,22 +253,20 @@ class FTS5Manager:
         if not prefix or len(prefix) < 2:
             return []
 
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
         # Query with wildcard for prefix
         fts_query = f"{field}:{prefix}*"
 
         try:
-            results = cursor.execute("""
-                SELECT DISTINCT i.label
-                FROM items_fts
-                JOIN items i ON items_fts.rowid = i.id
-                WHERE items_fts MATCH ?
-                  AND i.is_active = 1
-                ORDER BY bm25(items_fts)
-                LIMIT ?
-            """, (fts_query, limit)).fetchall()
+            with self.db.read_connection() as conn:
+                results = conn.execute("""
+                    SELECT DISTINCT i.label
+                    FROM items_fts
+                    JOIN items i ON items_fts.rowid = i.id
+                    WHERE items_fts MATCH ?
+                      AND i.is_active = 1
+                    ORDER BY bm25(items_fts)
+                    LIMIT ?
+                """, (fts_query, limit)).fetchall()
 
             suggestions = [row[0] for row in results]
 
@@ -361,34 +355,32 @@ class FTS5Manager:
 
         where_sql = " AND ".join(where_clauses)
 
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
         try:
-            results = cursor.execute(f"""
-                SELECT
-                    i.id,
-                    i.category_id,
-                    i.label,
-                    i.content,
-                    i.type,
-                    i.tags,
-                    i.description,
-                    i.is_favorite,
-                    i.is_sensitive,
-                    i.use_count,
-                    i.last_used,
-                    i.created_at,
-                    c.name as category_name,
-                    c.icon as category_icon,
-                    bm25(items_fts) as rank_score
-                FROM items_fts
-                JOIN items i ON items_fts.rowid = i.id
-                LEFT JOIN categories c ON i.category_id = c.id
-                WHERE {where_sql}
-                ORDER BY rank_score
-                LIMIT ?
-            """, params + [limit]).fetchall()
+            with self.db.read_connection() as conn:
+                results = conn.execute(f"""
+                    SELECT
+                        i.id,
+                        i.category_id,
+                        i.label,
+                        i.content,
+                        i.type,
+                        i.tags,
+                        i.description,
+                        i.is_favorite,
+                        i.is_sensitive,
+                        i.use_count,
+                        i.last_used,
+                        i.created_at,
+                        c.name as category_name,
+                        c.icon as category_icon,
+                        bm25(items_fts) as rank_score
+                    FROM items_fts
+                    JOIN items i ON items_fts.rowid = i.id
+                    LEFT JOIN categories c ON i.category_id = c.id
+                    WHERE {where_sql}
+                    ORDER BY rank_score
+                    LIMIT ?
+                """, params + [limit]).fetchall()
 
             execution_time = (time.time() - start_time) * 1000
 
@@ -425,14 +417,12 @@ class FTS5Manager:
 
         Use this if index gets corrupted or after major data changes
         """
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
         try:
-            cursor.execute("INSERT INTO items_fts(items_fts) VALUES('rebuild');")
-            cursor.execute("INSERT INTO categories_fts(categories_fts) VALUES('rebuild');")
-
-            conn.commit()
+            # Conexión de escritura compartida: serializada vía DBManager.transaction()
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute("INSERT INTO items_fts(items_fts) VALUES('rebuild');")
+                cursor.execute("INSERT INTO categories_fts(categories_fts) VALUES('rebuild');")
 
             logger.info("FTS5 index rebuilt successfully")
             return True
@@ -448,14 +438,11 @@ class FTS5Manager:
         Run periodically to maintain search performance
         Recommended: after bulk inserts/updates
         """
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
         try:
-            cursor.execute("INSERT INTO items_fts(items_fts) VALUES('optimize');")
-            cursor.execute("INSERT INTO categories_fts(categories_fts) VALUES('optimize');")
-
-            conn.commit()
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute("INSERT INTO items_fts(items_fts) VALUES('optimize');")
+                cursor.execute("INSERT INTO categories_fts(categories_fts) VALUES('optimize');")
 
             logger.info("FTS5 index optimized successfully")
             return True
@@ -479,25 +466,25 @@ class FTS5Manager:
             #     'index_size_kb': 150
             # }
         """
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
         stats = {}
 
         try:
-            # Count items (using original table to avoid FTS5 issues)
-            cursor.execute("SELECT COUNT(*) FROM items WHERE is_active = 1")
-            stats['items_indexed'] = cursor.fetchone()[0]
+            with self.db.read_connection() as conn:
+                cursor = conn.cursor()
+
+                # Count items (using original table to avoid FTS5 issues)
+                cursor.execute("SELECT COUNT(*) FROM items WHERE is_active = 1")
+                stats['items_indexed'] = cursor.fetchone()[0]
 
-            cursor.execute("SELECT COUNT(*) FROM categories WHERE is_active = 1")
-            stats['categories_indexed'] = cursor.fetchone()[0]
+                cursor.execute("SELECT COUNT(*) FROM categories WHERE is_active = 1")
+                stats['categories_indexed'] = cursor.fetchone()[0]
 
-            # Get database page info for size estimation
-            cursor.execute("PRAGMA page_count")
-            page_count = cursor.fetchone()[0]
+                # Get database page info for size estimation
+                cursor.execute("PRAGMA page_count")
+                page_count = cursor.fetchone()[0]
 
-            cursor.execute("PRAGMA page_size")
-            page_size = cursor.fetchone()[0]
+                cursor.execute("PRAGMA page_size")
+                page_size = cursor.fetchone()[0]
 
             stats['index_size_kb'] = (page_count * page_size) / 1024
 
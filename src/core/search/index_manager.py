@@ -92,17 +92,16 @@ class IndexManager:
             """,
         ]
 
-        cursor = self.db.connection.cursor()
-
         created_count = 0
-        for index_sql in indexes_sql:
-            try:
-                cursor.execute(index_sql)
-                created_count += 1
-            except sqlite3.OperationalError as e:
-                logger.warning(f"Index creation skipped: {e}")
-
-        self.db.connection.commit()
+        # transaction(): toma el lock de escritura de DBManager y hace commit al final
+        with self.db.transaction() as conn:
+            cursor = conn.cursor()
+            for index_sql in indexes_sql:
+                try:
+                    cursor.execute(index_sql)
+                    created_count += 1
+                except sqlite3.OperationalError as e:
+                    logger.warning(f"Index creation skipped: {e}")
 
         logger.info(f"Created/verified {created_count} B-Tree indexes for search")
 
@@ -115,11 +114,9 @@ class IndexManager:
         Runs ANALYZE command to update SQLite query planner statistics
         Should be run periodically (e.g., after bulk operations)
         """
-        cursor = self.db.connection.cursor()
-
         try:
-            cursor.execute("ANALYZE")
-            self.db.connection.commit()
+            with self.db.transaction() as conn:
+                conn.execute("ANALYZE")
 
             logger.info("Index statistics updated successfully")
             return True
@@ -146,20 +143,19 @@ class IndexManager:
                 ...
             ]
         """
-        cursor = self.db.connection.cursor()
-
         try:
             # Get all indexes
-            cursor.execute("""
-                SELECT name, tbl_name, sql
-                FROM sqlite_master
-                WHERE type = 'index'
-                  AND name LIKE 'idx_%search%'
-                ORDER BY name
-            """)
+            with self.db.read_connection() as conn:
+                rows = conn.execute("""
+                    SELECT name, tbl_name, sql
+                    FROM sqlite_master
+                    WHERE type = 'index'
+                      AND name LIKE 'idx_%search%'
+                    ORDER BY name
+                """).fetchall()
 
             indexes = []
-            for name, table, sql in cursor.fetchall():
+            for name, table, sql in rows:
                 indexes.append({
                     'name': name,
                     'table': table,
@@ -179,28 +175,27 @@ class IndexManager:
         WARNING: This will slow down searches until indexes are recreated
         Use only for maintenance or migration purposes
         """
-        cursor = self.db.connection.cursor()
+        dropped_count = 0
+        with self.db.transaction() as conn:
+            cursor = conn.cursor()
 
-        # Get all search index names
-        cursor.execute("""
-            SELECT name
-            FROM sqlite_master
-            WHERE type = 'index'
-              AND name LIKE 'idx_%search%'
-        """)
+            # Get all search index names
+            cursor.execute("""
+                SELECT name
+                FROM sqlite_master
+                WHERE type = 'index'
+                  AND name LIKE 'idx_%search%'
+            """)
 
-        index_names = [row[0] for row in cursor.fetchall()]
+            index_names = [row[0] for row in cursor.fetchall()]
 
-        dropped_count = 0
-        for index_name in index_names:
-            try:
-                cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
-                dropped_count += 1
-                logger.info(f"Dropped index: {index_name}")
-            except Exception as e:
-                logger.error(f"Failed to drop index {index_name}: {e}")
-
-        self.db.connection.commit()
+            for index_name in index_names:
+                try:
+                    cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+                    dropped_count += 1
+                    logger.info(f"Dropped index: {index_name}")
+                except Exception as e:
+                    logger.error(f"Failed to drop index {index_name}: {e}")
 
         logger.info(f"Dropped {dropped_count} search indexes")
 
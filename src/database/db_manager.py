@@ -3,33 +3,404 @@ Database Manager for Widget Sidebar
 Manages SQLite database operations for settings, categories, items, and clipboard history
 """
 
+import os
+import queue
 import sqlite3
 import json
 import logging
+import re
+import threading
 import uuid
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Iterator
 from contextlib import contextmanager
+from functools import lru_cache
 
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Tamaño de la caché de sentencias preparadas de sqlite3 (por defecto 128).
+# Las constantes _SQL_* y los SQL generados con lru_cache se preparan una vez y se
+# reutilizan mientras viva la conexión. El módulo sqlite3 no expone
+# SQLITE_PREPARE_PERSISTENT (apsw sí); con 512 entradas las sentencias calientes no
+# son desalojadas por SQL dinámico puntual (p.ej. UPDATE ... CASE de reordenación).
+_STATEMENT_CACHE_SIZE = 512
+
+# PRAGMAs de rendimiento aplicados una vez por conexión: WAL permite lectores
+# concurrentes durante escrituras y, con synchronous=NORMAL, reduce los fsync por commit
+_PERFORMANCE_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -65536;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA busy_timeout = 5000;
+"""
+
+# SQL de rutas calientes de tablas: texto idéntico entre llamadas para reutilizar
+# la sentencia ya preparada en la caché de la conexión
+_SQL_INSERT_TABLE_CELL = """
+    INSERT INTO items (
+        category_id, label, content, type,
+        is_table, name_table, orden_table,
+        is_list, list_group, orden_lista,
+        is_sensitive, tags, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_TABLE_NAME_EXISTS = """
+    SELECT EXISTS(SELECT 1 FROM items WHERE name_table = ? AND is_table = 1)
+"""
+
+_SQL_SELECT_TABLE_ITEMS = """
+    SELECT * FROM items
+    WHERE name_table = ? AND is_table = 1
+    ORDER BY row_idx, col_idx
+"""
+
+_SQL_SELECT_TABLE_CELL_ID = """
+    SELECT id FROM items
+    WHERE name_table = ? AND row_idx = ? AND col_idx = ? AND is_table = 1
+"""
+
+_SQL_UPDATE_TABLE_CELL_CONTENT = """
+    UPDATE items
+    SET content = ?, updated_at = ?
+    WHERE id = ?
+"""
+
+_SQL_UPDATE_TABLE_ROW_FIRST_CELL = """
+    UPDATE items
+    SET content = CASE WHEN id = ? THEN ? ELSE content END,
+        list_group = ?, tags = ?, updated_at = ?
+    WHERE name_table = ? AND is_table = 1 AND row_idx = ?
+"""
+
+# SQL de rutas calientes de procesos
+_SQL_SEARCH_PROCESSES = """
+    SELECT * FROM processes
+    WHERE is_active = 1 AND is_archived = 0
+        AND (name LIKE ? OR description LIKE ? OR tags LIKE ?)
+    ORDER BY use_count DESC, name ASC
+"""
+
+# Búsqueda por subcadena indexada (FTS5 trigram); requiere términos de 3+ caracteres
+_SQL_SEARCH_PROCESSES_FTS = """
+    SELECT p.* FROM processes p
+    JOIN processes_fts f ON f.rowid = p.id
+    WHERE p.is_active = 1 AND p.is_archived = 0
+        AND processes_fts MATCH ?
+    ORDER BY p.use_count DESC, p.name ASC
+"""
+
+_FTS_TRIGRAM_MIN_LENGTH = 3
+
+# Prefijo anclado ('term%'): SQLite lo convierte en rango sobre idx_processes_name_nocase
+# (LIKE optimization; requiere case_sensitive_like = OFF, valor por defecto)
+_SQL_SEARCH_PROCESSES_PREFIX = r"""
+    SELECT * FROM processes
+    WHERE is_active = 1 AND is_archived = 0
+        AND name LIKE ? ESCAPE '\'
+    ORDER BY use_count DESC, name ASC
+"""
+
+_LIKE_ESCAPE_RE = re.compile(r'([\\%_])')
+
+_SQL_CREATE_PROCESSES_FTS = """
+    CREATE VIRTUAL TABLE processes_fts USING fts5(
+        name, description, tags,
+        content='processes', content_rowid='id', tokenize='trigram'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS processes_fts_ai AFTER INSERT ON processes BEGIN
+        INSERT INTO processes_fts(rowid, name, description, tags)
+        VALUES (new.id, new.name, new.description, new.tags);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS processes_fts_ad AFTER DELETE ON processes BEGIN
+        INSERT INTO processes_fts(processes_fts, rowid, name, description, tags)
+        VALUES ('delete', old.id, old.name, old.description, old.tags);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS processes_fts_au AFTER UPDATE OF name, description, tags ON processes BEGIN
+        INSERT INTO processes_fts(processes_fts, rowid, name, description, tags)
+        VALUES ('delete', old.id, old.name, old.description, old.tags);
+        INSERT INTO processes_fts(rowid, name, description, tags)
+        VALUES (new.id, new.name, new.description, new.tags);
+    END;
+
+    INSERT INTO processes_fts(processes_fts) VALUES ('rebuild');
+"""
+
+_SQL_GET_PINNED_PROCESSES = """
+    SELECT * FROM processes
+    WHERE is_pinned = 1 AND is_active = 1 AND is_archived = 0
+    ORDER BY pinned_order ASC
+"""
+
+_SQL_ADD_PROCESS_STEP = """
+    INSERT INTO process_items (
+        process_id, item_id, step_order, custom_label,
+        is_optional, is_enabled, wait_for_confirmation,
+        notes, group_name
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_GET_PROCESS_STEPS = """
+    SELECT
+        pi.*,
+        i.label as item_label,
+        i.content as item_content,
+        i.type as item_type,
+        i.icon as item_icon,
+        i.is_sensitive as item_is_sensitive
+    FROM process_items pi
+    JOIN items i ON pi.item_id = i.id
+    WHERE pi.process_id = ?
+    ORDER BY pi.step_order ASC
+"""
+
+# Columnas explícitas en el orden posicional que espera ProcessStep.from_row
+_SQL_GET_PROCESS_STEP_ROWS = """
+    SELECT
+        pi.id, pi.process_id, pi.item_id, pi.step_order,
+        i.label, i.content, i.type, i.icon, i.is_sensitive,
+        pi.custom_label, pi.notes,
+        pi.is_optional, pi.is_enabled, pi.wait_for_confirmation,
+        pi.group_name, pi.group_order, pi.condition_type, pi.added_at
+    FROM process_items pi
+    JOIN items i ON pi.item_id = i.id
+    WHERE pi.process_id = ?
+    ORDER BY pi.step_order ASC
+"""
+
+_SQL_ADD_EXECUTION_HISTORY = """
+    INSERT INTO process_execution_history (
+        process_id, total_steps, status
+    ) VALUES (?, ?, 'running')
+"""
+
+_SQL_INCREMENT_PROCESS_USE = """
+    UPDATE processes
+    SET use_count = use_count + 1, last_used = ?, updated_at = ?
+    WHERE id = ?
+"""
+
+_SQL_GET_EXECUTION_HISTORY = """
+    SELECT * FROM process_execution_history
+    WHERE process_id = ?
+    ORDER BY started_at DESC
+    LIMIT ?
+"""
+
+# Filas por fetchmany() en lecturas por lotes
+_FETCH_BATCH_SIZE = 500
+
+# Máximo de IDs por sentencia UPDATE ... CASE (respeta SQLITE_MAX_VARIABLE_NUMBER = 999)
+_REORDER_CHUNK_SIZE = 300
+
+_SQL_REORDER_PROCESS_STEP = """
+    UPDATE process_items
+    SET step_order = ?
+    WHERE id = ? AND process_id = ?
+"""
+
+# A partir de este número de pasos se usa un único UPDATE ... CASE
+_REORDER_CASE_MIN_STEPS = 21
+
+# A partir de aquí el CASE (coste cuadrático por bloque) pierde frente a una tabla temporal
+_REORDER_TEMP_TABLE_MIN_STEPS = 200
+
+_SQL_CREATE_REORDER_TEMP_TABLE = """
+    CREATE TEMP TABLE IF NOT EXISTS reorder_process_steps (
+        id INTEGER PRIMARY KEY,
+        step_order INTEGER NOT NULL
+    )
+"""
+
+_SQL_REORDER_PROCESS_STEPS_FROM_TEMP = """
+    UPDATE process_items
+    SET step_order = r.step_order
+    FROM temp.reorder_process_steps AS r
+    WHERE r.id = process_items.id AND process_items.process_id = ?
+"""
+
+# Caracteres no permitidos en list_group (se conservan alfanuméricos, '_' y '-')
+_SANITIZE_RE = re.compile(r'[^\w\-]')
+
+
+class _ReadConnectionPool:
+    """
+    Pool of read-only connections for the "1 writer + N readers" pattern
+
+    Connections are opened lazily up to `size`; when all are checked out,
+    callers wait for one to be returned. With WAL enabled, readers on these
+    connections run concurrently with the single writer connection.
+    """
+
+    def __init__(self, opener, size: int):
+        """
+        Args:
+            opener: Callable returning a new configured read-only connection
+            size: Maximum number of connections to open
+        """
+        self._opener = opener
+        self._size = size
+        self._opened = 0
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self):
+        """Check out a read connection, returning it to the pool afterwards"""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._opened < self._size
+                if can_open:
+                    self._opened += 1
+            if can_open:
+                try:
+                    conn = self._opener()
+                except Exception:
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+            else:
+                conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        """Close all idle connections"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+
+
+class _RecordRow(sqlite3.Row):
+    """
+    Read-only sqlite3.Row with the dict-style lookups used by model factories
+
+    Lets read paths return rows as-is (C-implemented, no per-row dict copy)
+    while keeping `.get(key, default)` and `key in row` working like a dict.
+    """
+
+    __slots__ = ()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except IndexError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.keys()
+
+
+@lru_cache(maxsize=64)
+def _column_names(description: tuple) -> tuple:
+    """
+    Column names of a cursor.description, computed once per result shape
+
+    Lets read paths fetch raw tuples (row_factory = None) and build dicts with
+    dict(zip(names, row)) instead of dict(sqlite3.Row) per row.
+    """
+    return tuple(column[0] for column in description)
+
+
+@lru_cache(maxsize=64)
+def _update_by_id_sql(table: str, columns: tuple) -> str:
+    """
+    Build (once per table and column set) an UPDATE ... WHERE id = ? statement
+
+    Callers pass `columns` sorted so every kwargs order maps to the same SQL
+    text, which then hits the connection's statement cache.
+    """
+    assignments = ', '.join(f"{column} = ?" for column in columns)
+    return f"UPDATE {table} SET {assignments} WHERE id = ?"
+
+
+@lru_cache(maxsize=32)
+def _reorder_process_steps_case_sql(count: int) -> str:
+    """
+    Build (once per length) the UPDATE ... CASE that reorders `count` steps
+
+    Parameters: `count` (id, step_order) pairs, process_id, then `count` ids.
+    """
+    case_parts = ' '.join('WHEN ? THEN ?' for _ in range(count))
+    placeholders = ', '.join('?' for _ in range(count))
+    return (
+        f"UPDATE process_items SET step_order = CASE id {case_parts} END "
+        f"WHERE process_id = ? AND id IN ({placeholders})"
+    )
+
+
+def _utc_timestamp() -> str:
+    """
+    Current UTC time in SQLite's datetime('now') / CURRENT_TIMESTAMP format
+
+    Bound once per bulk operation instead of evaluating the SQL function per row.
+    """
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _sanitize_first_cell(value: str) -> str:
+    """
+    Sanitize first cell value of a table row for use as list_group
+
+    Args:
+        value: Original (stripped) cell value
+
+    Returns:
+        str: Value with spaces replaced by '_', special chars removed, max 50 chars
+    """
+    return _SANITIZE_RE.sub('', value.replace(' ', '_'))[:50]
+
+
+def _is_unique_violation(error: sqlite3.IntegrityError) -> bool:
+    """True if the IntegrityError comes from a UNIQUE constraint (not FOREIGN KEY/NOT NULL)"""
+    return str(error).startswith('UNIQUE constraint failed')
+
 
 class DBManager:
     """Gestor de base de datos SQLite para Widget Sidebar"""
 
-    def __init__(self, db_path: str = "widget_sidebar.db"):
+    def __init__(self, db_path: str = "widget_sidebar.db", tune_pragmas: bool = True):
         """
         Initialize database manager
 
         Args:
             db_path: Path to SQLite database file
+            tune_pragmas: Apply WAL journal and performance PRAGMAs on connect.
+                WAL mode creates '-wal' and '-shm' sidecar files next to the
+                database; pass False to keep SQLite defaults (e.g. in tests).
         """
         self.db_path = Path(db_path)
         self.connection = None
+        self.tune_pragmas = tune_pragmas
+        self._processes_fts_available = False
+        # Caché de get_categories por include_inactive; se invalida en cada escritura
+        # de categorías. La generación evita guardar una lectura que cruzó una escritura
+        self._categories_cache = {}
+        self._categories_generation = 0
+        # Escrituras serializadas sobre self.connection; lecturas en pool de solo lectura
+        self._write_lock = threading.RLock()
+        self._read_pool = _ReadConnectionPool(
+            lambda: self._open_connection(read_only=True),
+            size=min(8, os.cpu_count() or 1)
+        )
         self._ensure_database()
         logger.info(f"Database initialized at: {self.db_path}")
 
@@ -42,6 +413,123 @@ class DBManager:
             self._create_database()
         else:
             logger.info("Database already exists")
+        self._apply_schema_updates()
+
+    def _apply_schema_updates(self):
+        """
+        Apply idempotent schema additions (indices) on new and existing databases
+
+        Databases created by older versions never re-run _create_database, so
+        objects added after the initial schema are created here.
+        """
+        conn = self.connect()
+
+        # Coordenadas [row, col] de orden_table materializadas como columnas generadas.
+        # ALTER TABLE solo admite columnas VIRTUAL; el índice idx_items_table_rc almacena los valores.
+        item_columns = {row[1] for row in conn.execute("PRAGMA table_xinfo(items)")}
+        for column_name, json_path in (('row_idx', '$[0]'), ('col_idx', '$[1]')):
+            if column_name not in item_columns:
+                conn.execute(
+                    f"ALTER TABLE items ADD COLUMN {column_name} INTEGER GENERATED ALWAYS AS "
+                    f"(CASE WHEN json_valid(orden_table) THEN json_extract(orden_table, '{json_path}') END) VIRTUAL"
+                )
+
+        conn.executescript("""
+            -- Celdas de tablas: filtros por name_table/is_table y acceso por coordenada
+            CREATE INDEX IF NOT EXISTS idx_items_table ON items(name_table, is_table);
+            CREATE INDEX IF NOT EXISTS idx_items_table_rc ON items(name_table, row_idx, col_idx) WHERE is_table = 1;
+
+            -- Procesos visibles ya ordenados como los devuelve search_processes (sin filesort)
+            CREATE INDEX IF NOT EXISTS idx_processes_active_search
+                ON processes(use_count DESC, name) WHERE is_active = 1 AND is_archived = 0;
+            CREATE INDEX IF NOT EXISTS idx_processes_name_nocase
+                ON processes(name COLLATE NOCASE) WHERE is_active = 1 AND is_archived = 0;
+
+            -- Historial por proceso, más reciente primero
+            CREATE INDEX IF NOT EXISTS idx_execution_history_process_started
+                ON process_execution_history(process_id, started_at DESC);
+        """)
+
+        # Una celda por coordenada y tabla: también detecta nombres de tabla duplicados al insertar
+        try:
+            conn.executescript("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_items_unique_table_cell
+                    ON items(name_table, orden_table) WHERE is_table = 1;
+                DROP INDEX IF EXISTS idx_items_table_orden;
+            """)
+        except sqlite3.IntegrityError as e:
+            # Bases antiguas con celdas duplicadas: mantener índice no único
+            logger.warning(f"Could not create unique table cell index: {e}")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_items_table_orden "
+                "ON items(name_table, orden_table) WHERE is_table = 1"
+            )
+        conn.commit()
+
+        self._migrate_process_tags_to_json(conn)
+        self._processes_fts_available = self._ensure_processes_fts(conn)
+
+    def _migrate_process_tags_to_json(self, conn: sqlite3.Connection):
+        """
+        Convert legacy comma-separated processes.tags to JSON arrays
+
+        Also adds the tag_count generated column (json_array_length) and its index.
+
+        Args:
+            conn: Write connection
+        """
+        legacy_rows = conn.execute("""
+            SELECT id, tags FROM processes
+            WHERE tags IS NOT NULL AND tags != ''
+                AND (CASE WHEN json_valid(tags) THEN json_type(tags) END) IS NOT 'array'
+        """).fetchall()
+        if legacy_rows:
+            conn.executemany(
+                "UPDATE processes SET tags = ? WHERE id = ?",
+                [
+                    (json.dumps([tag.strip() for tag in tags.split(',') if tag.strip()], ensure_ascii=False),
+                     process_id)
+                    for process_id, tags in legacy_rows
+                ]
+            )
+            logger.info(f"Migrated tags of {len(legacy_rows)} processes to JSON")
+
+        process_columns = {row[1] for row in conn.execute("PRAGMA table_xinfo(processes)")}
+        if 'tag_count' not in process_columns:
+            conn.execute(
+                "ALTER TABLE processes ADD COLUMN tag_count INTEGER GENERATED ALWAYS AS "
+                "(CASE WHEN json_valid(tags) THEN json_array_length(tags) ELSE 0 END) VIRTUAL"
+            )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_processes_tag_count ON processes(tag_count)")
+        conn.commit()
+
+    def _ensure_processes_fts(self, conn: sqlite3.Connection) -> bool:
+        """
+        Create the processes_fts trigram index (and its sync triggers) if missing
+
+        Args:
+            conn: Write connection
+
+        Returns:
+            bool: True if FTS5 trigram search is available
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'processes_fts'"
+        ).fetchone()
+        if exists:
+            return True
+
+        try:
+            # executescript hace COMMIT previo; en caso de error se deshace lo parcial
+            conn.executescript(f"BEGIN; {_SQL_CREATE_PROCESSES_FTS} COMMIT;")
+            logger.info("Created processes_fts trigram index")
+            return True
+        except sqlite3.OperationalError as e:
+            # SQLite sin FTS5 o sin tokenizer trigram (< 3.34): búsqueda con LIKE
+            if conn.in_transaction:
+                conn.rollback()
+            logger.warning(f"FTS5 trigram not available, process search falls back to LIKE: {e}")
+            return False
 
     def connect(self) -> sqlite3.Connection:
         """
@@ -51,17 +539,45 @@ class DBManager:
             sqlite3.Connection: Database connection
         """
         if self.connection is None:
-            self.connection = sqlite3.connect(
+            self.connection = self._open_connection()
+        return self.connection
+
+    def _open_connection(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open and configure a new physical connection
+
+        PRAGMAs are per-connection state, so they are applied here exactly
+        once for every connection opened.
+
+        Args:
+            read_only: Open with SQLite URI mode=ro (used by the read pool)
+
+        Returns:
+            sqlite3.Connection: Configured database connection
+        """
+        if read_only:
+            conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE_SIZE
+            )
+        else:
+            conn = sqlite3.connect(
                 self.db_path,
-                check_same_thread=False
+                check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE_SIZE
             )
-            self.connection.row_factory = sqlite3.Row
-            # Enable foreign keys
-            self.connection.execute("PRAGMA foreign_keys = ON")
-        return self.connection
+        conn.row_factory = sqlite3.Row
+        # Enable foreign keys
+        conn.execute("PRAGMA foreign_keys = ON")
+        if self.tune_pragmas:
+            conn.executescript(_PERFORMANCE_PRAGMAS)
+        return conn
 
     def close(self):
         """Close database connection"""
+        self._read_pool.close()
         if self.connection:
             self.connection.close()
             self.connection = None
@@ -76,14 +592,46 @@ class DBManager:
             with db.transaction() as conn:
                 conn.execute(...)
         """
-        conn = self.connect()
-        try:
+        with self._acquire_write() as conn:
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Transaction failed: {e}")
+                raise
+
+    @contextmanager
+    def read_connection(self):
+        """
+        Context manager for read-only queries (read pool, no write lock)
+
+        Usage:
+            with db.read_connection() as conn:
+                conn.execute("SELECT ...")
+        """
+        with self._acquire_read() as conn:
             yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Transaction failed: {e}")
-            raise
+
+    @contextmanager
+    def _acquire_write(self):
+        """Hold the single writer connection (serialized across threads)"""
+        with self._write_lock:
+            yield self.connect()
+
+    @contextmanager
+    def _acquire_read(self):
+        """
+        Check out a read-only connection from the pool
+
+        In-memory databases are private to their connection, so they are
+        always read through the main connection.
+        """
+        if str(self.db_path) == ":memory:":
+            yield self.connect()
+        else:
+            with self._read_pool.acquire() as conn:
+                yield conn
 
     def _create_database(self):
         """Create database schema with all tables and indices - COMPLETE SCHEMA"""
@@ -521,10 +1069,11 @@ class DBManager:
             List[Dict]: Query results
         """
         try:
-            conn = self.connect()
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+            # Comparte la conexión de escritura: no intercalarse con otro hilo
+            with self._acquire_write() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
             return [dict(row) for row in rows]
         except sqlite3.Error as e:
             logger.error(f"Query execution failed: {e}")
@@ -544,11 +1093,11 @@ class DBManager:
             int: Last row ID for INSERT, or number of affected rows
         """
         try:
-            conn = self.connect()
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            conn.commit()
-            return cursor.lastrowid
+            with self._acquire_write() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                conn.commit()
+                return cursor.lastrowid
         except sqlite3.Error as e:
             logger.error(f"Update execution failed: {e}")
             logger.error(f"Query: {query}")
@@ -650,6 +1199,33 @@ class DBManager:
         """
         return self.execute_query(query, (include_inactive,))
 
+    def get_categories_cached(self, include_inactive: bool = False) -> List[Dict]:
+        """
+        Get categories like get_categories, served from memory after the first call
+
+        Intended for pickers (combos de categoría) opened repeatedly. The cache
+        is dropped by every category write in DBManager; code that updates the
+        categories table with raw SQL must call invalidate_categories_cache().
+
+        Args:
+            include_inactive: Include inactive categories
+
+        Returns:
+            List[Dict]: List of category dictionaries (shared, do not mutate)
+        """
+        cached = self._categories_cache.get(include_inactive)
+        if cached is None:
+            generation = self._categories_generation
+            cached = tuple(self.get_categories(include_inactive))
+            if generation == self._categories_generation:
+                self._categories_cache[include_inactive] = cached
+        return list(cached)
+
+    def invalidate_categories_cache(self) -> None:
+        """Drop cached category lists after a write to the categories table"""
+        self._categories_generation += 1
+        self._categories_cache.clear()
+
     def get_category(self, category_id: int) -> Optional[Dict]:
         """
         Get category by ID
@@ -695,6 +1271,7 @@ class DBManager:
             VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
         """
         category_id = self.execute_update(query, (name, icon, order_index, is_predefined, tags_json))
+        self.invalidate_categories_cache()
         logger.info(f"Category added: {name} (ID: {category_id}, order_index: {order_index}, tags: {tags})")
         return category_id
 
@@ -741,6 +1318,7 @@ class DBManager:
             params.append(category_id)
             query = f"UPDATE categories SET {', '.join(updates)} WHERE id = ?"
             self.execute_update(query, tuple(params))
+            self.invalidate_categories_cache()
             logger.info(f"Category updated: ID {category_id}")
 
     def delete_category(self, category_id: int) -> None:
@@ -752,6 +1330,7 @@ class DBManager:
         """
         query = "DELETE FROM categories WHERE id = ?"
         self.execute_update(query, (category_id,))
+        self.invalidate_categories_cache()
         logger.info(f"Category deleted: ID {category_id}")
 
     def toggle_category_active(self, category_id: int) -> bool:
@@ -840,6 +1419,7 @@ class DBManager:
         updates = [(i, cat_id) for i, cat_id in enumerate(category_ids)]
         query = "UPDATE categories SET order_index = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
         self.execute_many(query, updates)
+        self.invalidate_categories_cache()
         logger.info(f"Categories reordered: {len(category_ids)} items")
 
     # ========== ITEMS ==========
@@ -2931,11 +3511,14 @@ class DBManager:
             # Obtener todos los speed dials ordenados por posición actual
             speed_dials = self.get_speed_dials()
 
-            # Actualizar posiciones para que sean consecutivas
-            for index, sd in enumerate(speed_dials):
-                if sd['position'] != index:
-                    update_query = "UPDATE speed_dials SET position = ? WHERE id = ?"
-                    self.execute_update(update_query, (index, sd['id']))
+            # Actualizar posiciones para que sean consecutivas (una sola sentencia preparada)
+            updates = [
+                (index, sd['id'])
+                for index, sd in enumerate(speed_dials)
+                if sd['position'] != index
+            ]
+            if updates:
+                self.execute_many("UPDATE speed_dials SET position = ? WHERE id = ?", updates)
 
         except Exception as e:
             logger.error(f"Error al reorganizar speed dials: {e}")
@@ -3250,13 +3833,25 @@ class DBManager:
         Returns:
             bool: True si se reordenó correctamente
         """
+        tab_ids = list(tab_ids_in_order)
+        now = _utc_timestamp()
         try:
             with self.transaction() as conn:
                 cursor = conn.cursor()
-                for position, tab_id in enumerate(tab_ids_in_order):
+                # Un solo UPDATE ... CASE por bloque (3 parámetros por pestaña)
+                for start in range(0, len(tab_ids), _REORDER_CHUNK_SIZE):
+                    chunk = tab_ids[start:start + _REORDER_CHUNK_SIZE]
+                    case_parts = ' '.join('WHEN ? THEN ?' for _ in chunk)
+                    placeholders = ', '.join('?' for _ in chunk)
+                    params = []
+                    for position, tab_id in enumerate(chunk, start):
+                        params.extend((tab_id, position))
+                    params.append(now)
+                    params.extend(chunk)
                     cursor.execute(
-                        "UPDATE notebook_tabs SET position = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                        (position, tab_id)
+                        f"UPDATE notebook_tabs SET position = CASE id {case_parts} END, "
+                        f"updated_at = ? WHERE id IN ({placeholders})",
+                        params
                     )
             logger.info(f"Notebook tabs reordered: {len(tab_ids_in_order)} tabs")
             return True
@@ -3310,20 +3905,7 @@ class DBManager:
         """
         try:
             with self.transaction() as conn:
-                cursor = conn.cursor()
-
-                # Count active items in category
-                cursor.execute(
-                    "SELECT COUNT(*) as count FROM items WHERE category_id = ? AND is_active = 1",
-                    (category_id,)
-                )
-                count = cursor.fetchone()['count']
-
-                # Update category item_count
-                cursor.execute(
-                    "UPDATE categories SET item_count = ? WHERE id = ?",
-                    (count, category_id)
-                )
+                count = self._update_category_item_count_in_tx(conn.cursor(), category_id)
 
             logger.info(f"Updated item_count for category {category_id}: {count} items")
 
@@ -3331,6 +3913,31 @@ class DBManager:
             logger.error(f"Error updating category item_count for {category_id}: {e}")
             raise
 
+    def _update_category_item_count_in_tx(self, cursor: sqlite3.Cursor, category_id: int) -> int:
+        """
+        Recount active items of a category using an already open transaction.
+
+        Args:
+            cursor: Cursor of the caller's transaction
+            category_id: ID of the category to update
+
+        Returns:
+            int: New item_count value
+        """
+        # Count active items in category
+        cursor.execute(
+            "SELECT COUNT(*) as count FROM items WHERE category_id = ? AND is_active = 1",
+            (category_id,)
+        )
+        count = cursor.fetchone()['count']
+
+        # Update category item_count
+        cursor.execute(
+            "UPDATE categories SET item_count = ? WHERE id = ?",
+            (count, category_id)
+        )
+        return count
+
     # ==================== Table Operations ====================
 
     def add_table_items(self, category_id: str, table_name: str, table_data: list,
@@ -3357,16 +3964,14 @@ class DBManager:
 
             items_created = 0
             errors = []
+            now = _utc_timestamp()
 
             with self.transaction() as conn:
                 cursor = conn.cursor()
 
-                # Validate table name is unique
-                cursor.execute(
-                    "SELECT COUNT(*) as count FROM items WHERE name_table = ?",
-                    (table_name,)
-                )
-                if cursor.fetchone()['count'] > 0:
+                # Validate table name is unique (EXISTS sobre idx_items_table: para en la primera fila)
+                cursor.execute(_SQL_TABLE_NAME_EXISTS, (table_name,))
+                if cursor.fetchone()[0]:
                     logger.error(f"Table name '{table_name}' already exists")
                     return {
                         'success': False,
@@ -3384,6 +3989,13 @@ class DBManager:
                 # Prepare URL columns set for fast lookup
                 url_cols_set = set(url_columns) if url_columns else set()
 
+                # Resolver por columna (una vez) nombre, flag sensible y tipo de item
+                max_cols = max((len(r) for r in table_data), default=0)
+                resolved_columns = list(column_names)
+                resolved_columns.extend(f"COL_{i}" for i in range(len(column_names), max_cols))
+                col_is_sensitive = [1 if i in sensitive_cols_set else 0 for i in range(max_cols)]
+                col_item_type = ['URL' if i in url_cols_set else 'TEXT' for i in range(max_cols)]
+
                 # Insert each cell as an item
                 for row_idx, row_data in enumerate(table_data):
                     # Obtener el valor de la primera celda (nombre de fila)
@@ -3392,14 +4004,9 @@ class DBManager:
 
                     if len(row_data) > 0 and row_data[0]:
                         first_cell_original = str(row_data[0]).strip()
-                        first_cell_value = first_cell_original
 
                         # Sanitizar el valor para usarlo en list_group (remover caracteres especiales)
-                        first_cell_value = first_cell_value.replace(' ', '_')
-                        first_cell_value = ''.join(c for c in first_cell_value if c.isalnum() or c in ('_', '-'))
-                        # Limitar longitud
-                        if len(first_cell_value) > 50:
-                            first_cell_value = first_cell_value[:50]
+                        first_cell_value = _sanitize_first_cell(first_cell_original)
 
                     # Si la primera celda está vacía, usar row_N como fallback
                     if not first_cell_value:
@@ -3410,13 +4017,16 @@ class DBManager:
                     list_group_name = first_cell_value
 
                     for col_idx, cell_value in enumerate(row_data):
-                        # Skip empty cells
-                        if not cell_value or str(cell_value).strip() == '':
+                        # Skip empty cells (convert to str once and reuse below)
+                        if not cell_value:
+                            continue
+                        cell_str = cell_value if isinstance(cell_value, str) else str(cell_value)
+                        if not cell_str.strip():
                             continue
 
                         try:
                             # Create item for this cell
-                            column_name = column_names[col_idx] if col_idx < len(column_names) else f"COL_{col_idx}"
+                            column_name = resolved_columns[col_idx]
 
                             # Generar tags automáticos para esta celda
                             # Formato: ["tabla", "lista", "nombre_tabla", "nombre_fila", "nombre_columna"]
@@ -3432,50 +4042,48 @@ class DBManager:
                             tags_json = json.dumps(cell_tags)
 
                             # Determinar si esta columna es sensible
-                            is_sensitive = 1 if col_idx in sensitive_cols_set else 0
+                            is_sensitive = col_is_sensitive[col_idx]
 
                             # Determinar el tipo de item
-                            item_type = 'URL' if col_idx in url_cols_set else 'TEXT'
+                            item_type = col_item_type[col_idx]
 
                             # Cifrar contenido si es sensible
-                            content_to_store = str(cell_value)
+                            content_to_store = cell_str
                             if is_sensitive and content_to_store:
                                 from core.encryption_manager import EncryptionManager
                                 encryption_manager = EncryptionManager()
                                 content_to_store = encryption_manager.encrypt(content_to_store)
                                 logger.debug(f"Content encrypted for sensitive column '{column_name}' at [{row_idx}, {col_idx}]")
 
-                            cursor.execute("""
-                                INSERT INTO items (
-                                    category_id, label, content, type,
-                                    is_table, name_table, orden_table,
-                                    is_list, list_group, orden_lista,
-                                    is_sensitive, tags, created_at, updated_at
-                                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), datetime('now'))
-                            """, (
+                            cursor.execute(_SQL_INSERT_TABLE_CELL, (
                                 int(category_id),  # Convert to INTEGER
                                 column_name,  # Label = column name
                                 content_to_store,  # Content = cell value (cifrado si es sensible)
                                 item_type,  # Type (URL si está en url_columns, TEXT por defecto)
                                 1,  # is_table = True
                                 table_name,  # name_table
-                                json.dumps([row_idx, col_idx]),  # orden_table as JSON [row, col]
+                                f"[{row_idx}, {col_idx}]",  # orden_table as JSON [row, col] (same text as json.dumps)
                                 1,  # is_list = True (for row grouping)
                                 list_group_name,  # list_group = {table_name}_{primera_celda}
                                 col_idx + 1,  # orden_lista = column index + 1 (empieza en 1)
                                 is_sensitive,  # is_sensitive (1 si columna marcada como sensible)
-                                tags_json  # tags en formato JSON: ["tabla", "nombre_tabla", "nombre_fila", "nombre_columna"]
+                                tags_json,  # tags en formato JSON: ["tabla", "nombre_tabla", "nombre_fila", "nombre_columna"]
+                                now,  # created_at
+                                now  # updated_at
                             ))
 
                             items_created += 1
 
                         except Exception as e:
+                            if isinstance(e, sqlite3.IntegrityError) and _is_unique_violation(e):
+                                # Celda ya existente (idx_items_unique_table_cell): abortar toda la tabla
+                                raise
                             error_msg = f"Error creating item at [{row_idx}, {col_idx}]: {e}"
                             logger.error(error_msg)
                             errors.append(error_msg)
 
-            # Update category item_count (outside transaction)
-            self.update_category_item_count(category_id)
+                # Update category item_count (same transaction, single commit)
+                self._update_category_item_count_in_tx(cursor, category_id)
 
             logger.info(f"✓ Table '{table_name}' created: {items_created} items")
 
@@ -3486,6 +4094,24 @@ class DBManager:
                 'errors': errors
             }
 
+        except sqlite3.IntegrityError as e:
+            if not _is_unique_violation(e):
+                logger.error(f"Error creating table '{table_name}': {e}", exc_info=True)
+                return {
+                    'success': False,
+                    'items_created': 0,
+                    'table_name': table_name,
+                    'errors': [str(e)]
+                }
+            # Misma tabla creada entre el pre-check y el insert (idx_items_unique_table_cell)
+            logger.error(f"Table name '{table_name}' already exists")
+            return {
+                'success': False,
+                'items_created': 0,
+                'table_name': table_name,
+                'errors': [f"Table name '{table_name}' already exists"]
+            }
+
         except Exception as e:
             logger.error(f"Error creating table '{table_name}': {e}", exc_info=True)
             return {
@@ -3508,25 +4134,7 @@ class DBManager:
         try:
             logger.info(f"Retrieving items for table '{table_name}'")
 
-            query = """
-                SELECT * FROM items
-                WHERE name_table = ? AND is_table = 1
-                ORDER BY orden_table
-            """
-            results = self.execute_query(query, (table_name,))
-
-            # Parse tags for each item
-            for item in results:
-                if item['tags']:
-                    try:
-                        item['tags'] = json.loads(item['tags'])
-                    except json.JSONDecodeError:
-                        if isinstance(item['tags'], str):
-                            item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
-                        else:
-                            item['tags'] = []
-                else:
-                    item['tags'] = []
+            results = list(self.get_table_items_iter(table_name))
 
             logger.info(f"Found {len(results)} items for table '{table_name}'")
             return results
@@ -3535,6 +4143,39 @@ class DBManager:
             logger.error(f"Error retrieving table items for '{table_name}': {e}")
             return []
 
+    def get_table_items_iter(self, table_name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream items belonging to a specific table, one row at a time
+
+        Rows are read straight from the cursor, so only the current item is
+        materialized. A read-only pool connection is held until the iterator
+        is exhausted or closed. Use for single-pass consumers such as exports.
+
+        Args:
+            table_name: Name of the table
+
+        Yields:
+            Item dictionaries ordered by [row, col] with 'tags' parsed to a list
+        """
+        # Conexión del pool de lectura, reservada mientras dure la iteración
+        with self._acquire_read() as conn:
+            cursor = conn.execute(_SQL_SELECT_TABLE_ITEMS, (table_name,))
+
+            for row in cursor:
+                item = dict(row)
+
+                # Parse tags: JSON list (add_table_items) or
+                # comma-separated string (update_table_cell)
+                tags = item['tags']
+                if not tags or not isinstance(tags, str):
+                    item['tags'] = []
+                elif tags[0] == '[':
+                    item['tags'] = json.loads(tags)
+                else:
+                    item['tags'] = [tag.strip() for tag in tags.split(',') if tag.strip()]
+
+                yield item
+
     def get_tables_by_category(self, category_id: str) -> list:
         """
         Get list of all tables in a category
@@ -3548,52 +4189,33 @@ class DBManager:
         try:
             logger.info(f"Getting tables for category {category_id}")
 
-            with self.transaction() as conn:
-                cursor = conn.cursor()
-
-                # Get unique table names in this category
-                cursor.execute("""
-                    SELECT
-                        name_table,
-                        COUNT(*) as item_count,
-                        MIN(created_at) as created_at
-                    FROM items
-                    WHERE category_id = ? AND is_table = 1 AND name_table IS NOT NULL
-                    GROUP BY name_table
-                    ORDER BY created_at DESC
-                """, (category_id,))
-
-                tables = []
-                for row in cursor.fetchall():
-                    table_name = row['name_table']
-
-                    # Get dimensions (max row and col from orden_table)
-                    cursor.execute("""
-                        SELECT orden_table FROM items
-                        WHERE name_table = ? AND is_table = 1
-                    """, (table_name,))
-
-                    coords = []
-                    for item_row in cursor.fetchall():
-                        try:
-                            coord = json.loads(item_row['orden_table'])
-                            coords.append(coord)
-                        except:
-                            continue
-
-                    max_row = max([c[0] for c in coords]) + 1 if coords else 0
-                    max_col = max([c[1] for c in coords]) + 1 if coords else 0
-
-                    tables.append({
-                        'name': table_name,
-                        'rows': max_row,
-                        'cols': max_col,
-                        'item_count': row['item_count'],
-                        'created_at': row['created_at']
-                    })
+            # Nombre, conteo y dimensiones (máximo row_idx/col_idx) en una sola consulta
+            results = self.execute_query("""
+                SELECT
+                    name_table,
+                    COUNT(*) as item_count,
+                    MIN(created_at) as created_at,
+                    COALESCE(MAX(row_idx) + 1, 0) as rows,
+                    COALESCE(MAX(col_idx) + 1, 0) as cols
+                FROM items
+                WHERE category_id = ? AND is_table = 1 AND name_table IS NOT NULL
+                GROUP BY name_table
+                ORDER BY created_at DESC
+            """, (category_id,))
+
+            tables = [
+                {
+                    'name': row['name_table'],
+                    'rows': row['rows'],
+                    'cols': row['cols'],
+                    'item_count': row['item_count'],
+                    'created_at': row['created_at']
+                }
+                for row in results
+            ]
 
-                logger.info(f"Found {len(tables)} tables in category {category_id}")
-                return tables
+            logger.info(f"Found {len(tables)} tables in category {category_id}")
+            return tables
 
         except Exception as e:
             logger.error(f"Error getting tables for category {category_id}: {e}")
@@ -3615,74 +4237,34 @@ class DBManager:
         try:
             logger.info(f"Updating table '{table_name}' cell [{row}, {col}]")
 
-            orden_json = json.dumps([row, col])
-
             with self.transaction() as conn:
                 cursor = conn.cursor()
 
                 # Find item at this position
-                cursor.execute("""
-                    SELECT id FROM items
-                    WHERE name_table = ? AND orden_table = ? AND is_table = 1
-                """, (table_name, orden_json))
+                cursor.execute(_SQL_SELECT_TABLE_CELL_ID, (table_name, row, col))
 
                 result = cursor.fetchone()
 
                 if result:
-                    # Update existing item
                     item_id = result['id']
-                    cursor.execute("""
-                        UPDATE items
-                        SET content = ?, updated_at = datetime('now')
-                        WHERE id = ?
-                    """, (new_content, item_id))
 
-                    # Si se actualizó la primera columna, actualizar list_group y tags de toda la fila
+                    # Si se actualiza la primera columna, list_group y tags de toda la fila cambian
+                    first_cell_value = ""
                     if col == 0 and new_content and new_content.strip():
-                        # Sanitizar el nuevo valor para list_group y tag
-                        first_cell_value = new_content.strip()
-                        first_cell_value = first_cell_value.replace(' ', '_')
-                        first_cell_value = ''.join(c for c in first_cell_value if c.isalnum() or c in ('_', '-'))
-                        if len(first_cell_value) > 50:
-                            first_cell_value = first_cell_value[:50]
-
-                        if first_cell_value:
-                            new_list_group = f"{table_name}_{first_cell_value}"
-
-                            # Obtener el tag anterior de la primera celda para reemplazarlo
-                            cursor.execute("""
-                                SELECT tags FROM items
-                                WHERE name_table = ? AND is_table = 1
-                                AND json_extract(orden_table, '$[0]') = ?
-                                LIMIT 1
-                            """, (table_name, row))
-
-                            old_tags_result = cursor.fetchone()
-                            if old_tags_result and old_tags_result['tags']:
-                                old_tags = old_tags_result['tags']
-                                # Separar tags existentes
-                                tag_list = [t.strip() for t in old_tags.split(',') if t.strip()]
-
-                                # Remover el tag anterior de la primera celda (el último tag que no sea table_name)
-                                # Mantener solo table_name y otros tags, agregar el nuevo
-                                filtered_tags = [t for t in tag_list if t == table_name or not any(c in t for c in ['_', '-']) or t == table_name]
-                                # Simplemente agregar el nuevo tag
-                                if table_name in tag_list:
-                                    new_tags = f"{table_name},{first_cell_value}"
-                                else:
-                                    new_tags = f"{table_name},{first_cell_value}"
-                            else:
-                                new_tags = f"{table_name},{first_cell_value}"
-
-                            # Actualizar list_group y tags de todos los items de esta fila
-                            cursor.execute("""
-                                UPDATE items
-                                SET list_group = ?, tags = ?, updated_at = datetime('now')
-                                WHERE name_table = ? AND is_table = 1
-                                AND json_extract(orden_table, '$[0]') = ?
-                            """, (new_list_group, new_tags, table_name, row))
-
-                            logger.info(f"✓ Updated list_group and tags for row {row} to '{new_list_group}' and '{new_tags}'")
+                        first_cell_value = _sanitize_first_cell(new_content.strip())
+
+                    if first_cell_value:
+                        new_list_group = f"{table_name}_{first_cell_value}"
+                        new_tags = f"{table_name},{first_cell_value}"
+
+                        # Contenido de la celda + list_group/tags de la fila en un solo UPDATE
+                        cursor.execute(_SQL_UPDATE_TABLE_ROW_FIRST_CELL, (
+                            item_id, new_content, new_list_group, new_tags, _utc_timestamp(), table_name, row
+                        ))
+
+                        logger.info(f"✓ Updated list_group and tags for row {row} to '{new_list_group}' and '{new_tags}'")
+                    else:
+                        cursor.execute(_SQL_UPDATE_TABLE_CELL_CONTENT, (new_content, _utc_timestamp(), item_id))
 
                     logger.info(f"✓ Cell updated successfully")
                     return True
@@ -3710,27 +4292,27 @@ class DBManager:
             with self.transaction() as conn:
                 cursor = conn.cursor()
 
-                # Get category_id before deleting (for updating item_count)
-                cursor.execute("""
-                    SELECT DISTINCT category_id FROM items
-                    WHERE name_table = ? AND is_table = 1
-                    LIMIT 1
-                """, (table_name,))
-
-                result = cursor.fetchone()
-                category_id = result['category_id'] if result else None
-
-                # Delete all items from this table
+                # Delete all items from this table, collecting affected categories
                 cursor.execute("""
                     DELETE FROM items
                     WHERE name_table = ? AND is_table = 1
+                    RETURNING category_id
                 """, (table_name,))
 
+                category_ids = list({row['category_id'] for row in cursor.fetchall()})
                 deleted_count = cursor.rowcount
 
-            # Update category item_count if needed (outside transaction)
-            if category_id:
-                self.update_category_item_count(category_id)
+                # Update item_count of affected categories (same transaction, single commit)
+                if category_ids:
+                    placeholders = ', '.join('?' for _ in category_ids)
+                    cursor.execute(f"""
+                        UPDATE categories
+                        SET item_count = (
+                            SELECT COUNT(*) FROM items
+                            WHERE category_id = categories.id AND is_active = 1
+                        )
+                        WHERE id IN ({placeholders})
+                    """, category_ids)
 
             logger.info(f"✓ Table '{table_name}' deleted: {deleted_count} items removed")
             return True
@@ -3763,9 +4345,35 @@ class DBManager:
         try:
             logger.info(f"Exporting table '{table_name}' to dict")
 
-            items = self.get_table_items(table_name)
+            # Single pass over the streamed items: collect (row, col, label, content)
+            # and track dimensions
+            cells = []
+            max_row = 0
+            max_col = 0
+            created_at = None
+            total_items = 0
+
+            for item in self.get_table_items_iter(table_name):
+                total_items += 1
+                try:
+                    row, col = item['row_idx'], item['col_idx']
+                    if row is None or col is None:
+                        # orden_table malformado: las columnas generadas dan NULL
+                        logger.warning(f"Skipping item with invalid orden_table: {item['orden_table']!r}")
+                        continue
+                    cells.append((row, col, item['label'], item['content']))
+                    if row > max_row:
+                        max_row = row
+                    if col > max_col:
+                        max_col = col
 
-            if not items:
+                    if created_at is None or item['created_at'] < created_at:
+                        created_at = item['created_at']
+                except Exception as e:
+                    logger.warning(f"Error parsing item coordinates: {e}")
+                    continue
+
+            if not total_items:
                 logger.warning(f"No items found for table '{table_name}'")
                 return {
                     'table_name': table_name,
@@ -3779,47 +4387,14 @@ class DBManager:
                     }
                 }
 
-            # Build coordinate map
-            cells = {}  # {(row, col): {'label': str, 'content': str}}
-            max_row = 0
-            max_col = 0
-            created_at = None
-
-            for item in items:
-                try:
-                    coord = json.loads(item['orden_table'])
-                    row, col = coord[0], coord[1]
-                    cells[(row, col)] = {
-                        'label': item['label'],
-                        'content': item['content']
-                    }
-                    max_row = max(max_row, row)
-                    max_col = max(max_col, col)
-
-                    if created_at is None or item['created_at'] < created_at:
-                        created_at = item['created_at']
-                except Exception as e:
-                    logger.warning(f"Error parsing item coordinates: {e}")
-                    continue
+            # Preallocate matrix and column names (row 0 labels override generated names)
+            rows = [[''] * (max_col + 1) for _ in range(max_row + 1)]
+            columns = [f"COL_{col}" for col in range(max_col + 1)]
 
-            # Extract column names (from row 0 labels or generate)
-            columns = []
-            for col in range(max_col + 1):
-                if (0, col) in cells:
-                    columns.append(cells[(0, col)]['label'])
-                else:
-                    columns.append(f"COL_{col}")
-
-            # Build rows matrix
-            rows = []
-            for row in range(max_row + 1):
-                row_data = []
-                for col in range(max_col + 1):
-                    if (row, col) in cells:
-                        row_data.append(cells[(row, col)]['content'])
-                    else:
-                        row_data.append('')  # Empty cell
-                rows.append(row_data)
+            for row, col, label, content in cells:
+                rows[row][col] = content
+                if row == 0:
+                    columns[col] = label
 
             result = {
                 'table_name': table_name,
@@ -3829,7 +4404,7 @@ class DBManager:
                     'created_at': str(created_at) if created_at else None,
                     'total_rows': max_row + 1,
                     'total_cols': max_col + 1,
-                    'total_items': len(items)
+                    'total_items': total_items
                 }
             }
 
@@ -3866,7 +4441,7 @@ class DBManager:
             color: Process color (hex)
             execution_mode: Execution mode (sequential, parallel, manual)
             delay_between_steps: Delay in milliseconds between steps
-            tags: Comma-separated tags
+            tags: Tags as a JSON array (see models.process.dump_tags)
             category: Category name
 
         Returns:
@@ -3885,7 +4460,7 @@ class DBManager:
             logger.info(f"Process created: {name} (ID: {process_id})")
             return process_id
 
-    def get_process(self, process_id: int) -> Optional[Dict[str, Any]]:
+    def get_process(self, process_id: int) -> Optional[sqlite3.Row]:
         """
         Get process by ID
 
@@ -3893,20 +4468,18 @@ class DBManager:
             process_id: Process ID
 
         Returns:
-            Dict with process data or None
+            Read-only row mapping with process data or None
         """
-        conn = self.connect()
-        cursor = conn.execute("""
-            SELECT * FROM processes WHERE id = ?
-        """, (process_id,))
+        with self._acquire_read() as conn:
+            cursor = conn.execute("""
+                SELECT * FROM processes WHERE id = ?
+            """, (process_id,))
+            cursor.row_factory = _RecordRow
 
-        row = cursor.fetchone()
-        if row:
-            return dict(row)
-        return None
+            return cursor.fetchone()
 
     def get_all_processes(self, include_archived: bool = False,
-                          include_inactive: bool = False) -> List[Dict[str, Any]]:
+                          include_inactive: bool = False) -> List[sqlite3.Row]:
         """
         Get all processes
 
@@ -3915,10 +4488,8 @@ class DBManager:
             include_inactive: Include inactive processes
 
         Returns:
-            List of process dicts
+            List of read-only process row mappings
         """
-        conn = self.connect()
-
         query = "SELECT * FROM processes WHERE 1=1"
         params = []
 
@@ -3930,8 +4501,10 @@ class DBManager:
 
         query += " ORDER BY pinned_order ASC, order_index ASC, name ASC"
 
-        cursor = conn.execute(query, params)
-        return [dict(row) for row in cursor.fetchall()]
+        with self._acquire_read() as conn:
+            cursor = conn.execute(query, params)
+            cursor.row_factory = _RecordRow
+            return cursor.fetchall()
 
     def update_process(self, process_id: int, **kwargs) -> bool:
         """
@@ -3950,14 +4523,12 @@ class DBManager:
         # Add updated_at timestamp
         kwargs['updated_at'] = datetime.now().isoformat()
 
-        # Build UPDATE query
-        fields = ', '.join(f"{k} = ?" for k in kwargs.keys())
-        values = list(kwargs.values()) + [process_id]
+        # Build UPDATE query (columnas ordenadas -> SQL cacheado)
+        columns = tuple(sorted(kwargs))
+        values = [kwargs[k] for k in columns] + [process_id]
 
         with self.transaction() as conn:
-            conn.execute(f"""
-                UPDATE processes SET {fields} WHERE id = ?
-            """, values)
+            conn.execute(_update_by_id_sql('processes', columns), values)
 
         logger.info(f"Process {process_id} updated: {list(kwargs.keys())}")
         return True
@@ -3978,43 +4549,49 @@ class DBManager:
         logger.info(f"Process {process_id} deleted")
         return True
 
-    def search_processes(self, query: str) -> List[Dict[str, Any]]:
+    def search_processes(self, query: str, prefix_only: bool = False) -> List[sqlite3.Row]:
         """
         Search processes by name, description, or tags
 
+        Uses the processes_fts trigram index for queries of 3+ characters;
+        shorter queries (or SQLite builds without FTS5 trigram) use LIKE.
+
         Args:
             query: Search query
+            prefix_only: Only match names starting with query (search-as-you-type);
+                runs as an index range scan on idx_processes_name_nocase
 
         Returns:
-            List of matching processes
-        """
-        conn = self.connect()
-        search_pattern = f"%{query}%"
-
-        cursor = conn.execute("""
-            SELECT * FROM processes
-            WHERE (name LIKE ? OR description LIKE ? OR tags LIKE ?)
-                AND is_active = 1 AND is_archived = 0
-            ORDER BY use_count DESC, name ASC
-        """, (search_pattern, search_pattern, search_pattern))
+            List of matching processes (read-only row mappings)
+        """
+        with self._acquire_read() as conn:
+            if prefix_only:
+                # '%' y '_' del usuario son literales, no comodines
+                prefix_pattern = _LIKE_ESCAPE_RE.sub(r'\\\1', query) + '%'
+                cursor = conn.execute(_SQL_SEARCH_PROCESSES_PREFIX, (prefix_pattern,))
+            elif self._processes_fts_available and len(query) >= _FTS_TRIGRAM_MIN_LENGTH:
+                # Frase entre comillas: subcadena literal, sin operadores FTS5
+                phrase = '"' + query.replace('"', '""') + '"'
+                cursor = conn.execute(_SQL_SEARCH_PROCESSES_FTS, (phrase,))
+            else:
+                search_pattern = f"%{query}%"
+                cursor = conn.execute(_SQL_SEARCH_PROCESSES, (search_pattern, search_pattern, search_pattern))
+            cursor.row_factory = _RecordRow
 
-        return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
 
-    def get_pinned_processes(self) -> List[Dict[str, Any]]:
+    def get_pinned_processes(self) -> List[sqlite3.Row]:
         """
         Get all pinned processes
 
         Returns:
-            List of pinned processes ordered by pinned_order
+            List of pinned processes (read-only row mappings) ordered by pinned_order
         """
-        conn = self.connect()
-        cursor = conn.execute("""
-            SELECT * FROM processes
-            WHERE is_pinned = 1 AND is_active = 1 AND is_archived = 0
-            ORDER BY pinned_order ASC
-        """)
+        with self._acquire_read() as conn:
+            cursor = conn.execute(_SQL_GET_PINNED_PROCESSES)
+            cursor.row_factory = _RecordRow
 
-        return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
 
     # ==================== PROCESS STEPS (process_items) ====================
 
@@ -4040,20 +4617,35 @@ class DBManager:
             int: ID of created process_item
         """
         with self.transaction() as conn:
-            cursor = conn.execute("""
-                INSERT INTO process_items (
-                    process_id, item_id, step_order, custom_label,
-                    is_optional, is_enabled, wait_for_confirmation,
-                    notes, group_name
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (process_id, item_id, step_order, custom_label,
-                  int(is_optional), int(is_enabled), int(wait_for_confirmation),
+            cursor = conn.execute(_SQL_ADD_PROCESS_STEP, (process_id, item_id, step_order, custom_label,
+                  is_optional, is_enabled, wait_for_confirmation,
                   notes, group_name))
 
             step_id = cursor.lastrowid
             logger.info(f"Step added to process {process_id}: item {item_id} at order {step_order}")
             return step_id
 
+    def add_process_steps_bulk(self, step_rows: List[tuple]) -> int:
+        """
+        Add several process steps in a single transaction
+
+        Args:
+            step_rows: Tuples (process_id, item_id, step_order, custom_label,
+                is_optional, is_enabled, wait_for_confirmation, notes, group_name),
+                e.g. from ProcessStep.to_row()
+
+        Returns:
+            int: Number of steps inserted
+        """
+        if not step_rows:
+            return 0
+
+        with self.transaction() as conn:
+            conn.executemany(_SQL_ADD_PROCESS_STEP, step_rows)
+
+        logger.info(f"Added {len(step_rows)} process steps")
+        return len(step_rows)
+
     def get_process_steps(self, process_id: int) -> List[Dict[str, Any]]:
         """
         Get all steps of a process with item details
@@ -4064,22 +4656,30 @@ class DBManager:
         Returns:
             List of steps with item information
         """
-        conn = self.connect()
-        cursor = conn.execute("""
-            SELECT
-                pi.*,
-                i.label as item_label,
-                i.content as item_content,
-                i.type as item_type,
-                i.icon as item_icon,
-                i.is_sensitive as item_is_sensitive
-            FROM process_items pi
-            JOIN items i ON pi.item_id = i.id
-            WHERE pi.process_id = ?
-            ORDER BY pi.step_order ASC
-        """, (process_id,))
-
-        return [dict(row) for row in cursor.fetchall()]
+        with self._acquire_read() as conn:
+            cursor = conn.execute(_SQL_GET_PROCESS_STEPS, (process_id,))
+            cursor.row_factory = None
+            names = _column_names(cursor.description)
+
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def get_process_step_rows(self, process_id: int) -> List[tuple]:
+        """
+        Get all steps of a process as plain tuples (no per-row mapping)
+
+        Column order matches ProcessStep.from_row().
+
+        Args:
+            process_id: Process ID
+
+        Returns:
+            List of step tuples ordered by step_order
+        """
+        with self._acquire_read() as conn:
+            cursor = conn.execute(_SQL_GET_PROCESS_STEP_ROWS, (process_id,))
+            cursor.row_factory = None
+
+            return cursor.fetchall()
 
     def update_process_step(self, step_id: int, **kwargs) -> bool:
         """
@@ -4095,13 +4695,12 @@ class DBManager:
         if not kwargs:
             return True
 
-        fields = ', '.join(f"{k} = ?" for k in kwargs.keys())
-        values = list(kwargs.values()) + [step_id]
+        # Orden canónico de columnas: misma forma de UPDATE -> mismo texto SQL en caché
+        columns = tuple(sorted(kwargs))
+        values = [kwargs[k] for k in columns] + [step_id]
 
         with self.transaction() as conn:
-            conn.execute(f"""
-                UPDATE process_items SET {fields} WHERE id = ?
-            """, values)
+            conn.execute(_update_by_id_sql('process_items', columns), values)
 
         logger.info(f"Process step {step_id} updated")
         return True
@@ -4150,13 +4749,35 @@ class DBManager:
         Returns:
             bool: Success status
         """
+        step_ids = list(step_ids_in_order)
+
         with self.transaction() as conn:
-            for new_order, step_id in enumerate(step_ids_in_order, start=1):
-                conn.execute("""
-                    UPDATE process_items
-                    SET step_order = ?
-                    WHERE id = ? AND process_id = ?
-                """, (new_order, step_id, process_id))
+            if len(step_ids) < _REORDER_CASE_MIN_STEPS:
+                # Pocos pasos: una sentencia preparada reutilizada
+                conn.executemany(_SQL_REORDER_PROCESS_STEP, [
+                    (new_order, step_id, process_id)
+                    for new_order, step_id in enumerate(step_ids, start=1)
+                ])
+            elif len(step_ids) >= _REORDER_TEMP_TABLE_MIN_STEPS:
+                # Procesos muy largos: cargar el orden en una tabla temporal y un único UPDATE ... FROM
+                conn.execute(_SQL_CREATE_REORDER_TEMP_TABLE)
+                conn.execute("DELETE FROM temp.reorder_process_steps")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO temp.reorder_process_steps (id, step_order) VALUES (?, ?)",
+                    [(step_id, new_order) for new_order, step_id in enumerate(step_ids, start=1)]
+                )
+                conn.execute(_SQL_REORDER_PROCESS_STEPS_FROM_TEMP, (process_id,))
+                conn.execute("DELETE FROM temp.reorder_process_steps")
+            else:
+                # Muchos pasos: un UPDATE ... CASE por bloque
+                for start in range(0, len(step_ids), _REORDER_CHUNK_SIZE):
+                    chunk = step_ids[start:start + _REORDER_CHUNK_SIZE]
+                    params = []
+                    for new_order, step_id in enumerate(chunk, start + 1):
+                        params.extend((step_id, new_order))
+                    params.append(process_id)
+                    params.extend(chunk)
+                    conn.execute(_reorder_process_steps_case_sql(len(chunk)), params)
 
         logger.info(f"Reordered {len(step_ids_in_order)} steps for process {process_id}")
         return True
@@ -4175,11 +4796,7 @@ class DBManager:
             int: Execution history ID
         """
         with self.transaction() as conn:
-            cursor = conn.execute("""
-                INSERT INTO process_execution_history (
-                    process_id, total_steps, status
-                ) VALUES (?, ?, 'running')
-            """, (process_id, total_steps))
+            cursor = conn.execute(_SQL_ADD_EXECUTION_HISTORY, (process_id, total_steps))
 
             execution_id = cursor.lastrowid
             logger.info(f"Started execution tracking for process {process_id} (ID: {execution_id})")
@@ -4199,20 +4816,69 @@ class DBManager:
         if not kwargs:
             return True
 
-        # If status is being set to completed, set completed_at
-        if 'status' in kwargs and kwargs['status'] in ('completed', 'failed', 'cancelled'):
-            kwargs['completed_at'] = datetime.now().isoformat()
+        with self.transaction() as conn:
+            self._update_execution_history_in_tx(conn, execution_id, kwargs)
+
+        return True
+
+    def complete_execution(self, execution_id: Optional[int], process_id: int, **kwargs) -> bool:
+        """
+        Finish an execution: final history update + process usage stats in one commit
+
+        Replaces update_execution_history() followed by a use_count read and
+        update_process(), which cost two transactions and a read round trip.
 
-        fields = ', '.join(f"{k} = ?" for k in kwargs.keys())
-        values = list(kwargs.values()) + [execution_id]
+        Args:
+            execution_id: Execution history ID (None if tracking never started)
+            process_id: Process ID
+            **kwargs: Final history fields (status, completed_steps, failed_steps, duration_ms, error_message)
+
+        Returns:
+            bool: Success status
+        """
+        now = datetime.now().isoformat()
 
         with self.transaction() as conn:
-            conn.execute(f"""
-                UPDATE process_execution_history SET {fields} WHERE id = ?
-            """, values)
+            if execution_id and kwargs:
+                self._update_execution_history_in_tx(conn, execution_id, kwargs)
+            conn.execute(_SQL_INCREMENT_PROCESS_USE, (now, now, process_id))
 
         return True
 
+    def increment_process_use_count(self, process_id: int) -> None:
+        """
+        Increment use_count and set last_used in a single atomic UPDATE
+
+        Args:
+            process_id: Process ID
+        """
+        now = datetime.now().isoformat()
+        with self.transaction() as conn:
+            conn.execute(_SQL_INCREMENT_PROCESS_USE, (now, now, process_id))
+
+    def _update_execution_history_in_tx(self, conn: sqlite3.Connection, execution_id: int,
+                                        fields: Dict[str, Any]):
+        """
+        Update an execution history row inside an already-open transaction
+
+        Args:
+            conn: Connection holding the transaction
+            execution_id: Execution history ID
+            fields: Fields to update (copied; completed_at added for final statuses)
+        """
+        fields = dict(fields)
+
+        # If status is being set to completed, set completed_at (same UTC text
+        # format as started_at's CURRENT_TIMESTAMP, so julianday() math works)
+        if 'status' in fields and fields['status'] in ('completed', 'failed', 'cancelled'):
+            fields['completed_at'] = _utc_timestamp()
+
+        # Orden canónico de columnas: misma forma de UPDATE -> mismo texto SQL en caché
+        columns = tuple(sorted(fields))
+        values = [fields[k] for k in columns] + [execution_id]
+
+        conn.execute(_update_by_id_sql('process_execution_history', columns), values)
+
     def get_process_execution_history(self, process_id: int, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get execution history for a process
@@ -4224,15 +4890,33 @@ class DBManager:
         Returns:
             List of execution history records
         """
-        conn = self.connect()
-        cursor = conn.execute("""
-            SELECT * FROM process_execution_history
-            WHERE process_id = ?
-            ORDER BY started_at DESC
-            LIMIT ?
-        """, (process_id, limit))
+        return list(self.iter_process_execution_history(process_id, limit))
+
+    def iter_process_execution_history(self, process_id: int, limit: int = 10) -> Iterator[Dict[str, Any]]:
+        """
+        Stream execution history for a process in fetchmany() batches
 
-        return [dict(row) for row in cursor.fetchall()]
+        The pooled read connection stays checked out until the iterator is
+        exhausted or closed, so consume it promptly.
+
+        Args:
+            process_id: Process ID
+            limit: Maximum number of records
+
+        Yields:
+            Execution history records, newest first
+        """
+        with self._acquire_read() as conn:
+            cursor = conn.execute(_SQL_GET_EXECUTION_HISTORY, (process_id, limit))
+            cursor.arraysize = _FETCH_BATCH_SIZE
+            cursor.row_factory = None
+            names = _column_names(cursor.description)
+
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                yield from (dict(zip(names, row)) for row in rows)
 
     # ==================== Component Types Management ====================
 
@@ -4246,7 +4930,6 @@ class DBManager:
         Returns:
             List of component type dictionaries
         """
-        conn = self.connect()
         query = "SELECT * FROM component_types"
 
         if active_only:
@@ -4254,8 +4937,9 @@ class DBManager:
 
         query += " ORDER BY name"
 
-        cursor = conn.execute(query)
-        return [dict(row) for row in cursor.fetchall()]
+        with self._acquire_read() as conn:
+            cursor = conn.execute(query)
+            return [dict(row) for row in cursor.fetchall()]
 
     def get_component_type_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -4267,13 +4951,12 @@ class DBManager:
         Returns:
             Component type dictionary or None if not found
         """
-        conn = self.connect()
-        cursor = conn.execute("""
-            SELECT * FROM component_types
-            WHERE name = ?
-        """, (name,))
+        with self._acquire_read() as conn:
+            row = conn.execute("""
+                SELECT * FROM component_types
+                WHERE name = ?
+            """, (name,)).fetchone()
 
-        row = cursor.fetchone()
         return dict(row) if row else None
 
     def add_component_type(
@@ -4419,16 +5102,12 @@ class DBManager:
             Format: {'width': int, 'height': int, 'pos_x': int, 'pos_y': int}
         """
         try:
-            conn = self.connect()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT width, height, pos_x, pos_y, updated_at
-                FROM panel_settings
-                WHERE panel_name = ?
-            """, (panel_name,))
-
-            row = cursor.fetchone()
+            with self._acquire_read() as conn:
+                row = conn.execute("""
+                    SELECT width, height, pos_x, pos_y, updated_at
+                    FROM panel_settings
+                    WHERE panel_name = ?
+                """, (panel_name,)).fetchone()
 
             if row:
                 return {
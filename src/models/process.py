@@ -4,12 +4,83 @@ Process and ProcessStep Models
 Modelos de datos para la funcionalidad de PROCESOS
 """
 
+import json
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import List, Optional
 from datetime import datetime
 
 
-@dataclass
+def _parse_datetime(value) -> Optional[datetime]:
+    """Parse an ISO / SQLite timestamp (or pass a datetime through); None if invalid"""
+    if not value:
+        return None
+    value_type = type(value)
+    if value_type is str:
+        # fromisoformat acepta separador 'T' y espacio (formato SQLite);
+        # solo el sufijo 'Z' necesita reescritura (no soportado antes de 3.11)
+        if value[-1] == 'Z':
+            value = value[:-1] + '+00:00'
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if isinstance(value, datetime):
+        return value
+    return None
+
+
+def _parse_tags(value) -> List[str]:
+    """Parse tags stored as a JSON array (or legacy comma-separated text)"""
+    if not value:
+        return []
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        if value[0] == '[':
+            try:
+                return json.loads(value)
+            except json.JSONDecodeError:
+                pass
+        return [tag.strip() for tag in value.split(',') if tag.strip()]
+    return []
+
+
+def dump_tags(tags: List[str]) -> Optional[str]:
+    """
+    Serialize tags to the JSON array stored in processes.tags
+
+    Non-ASCII characters are kept as-is so LIKE / FTS substring search
+    over the column still matches accented tags.
+    """
+    return json.dumps(tags, ensure_ascii=False) if tags else None
+
+
+# Claves de to_dict (en orden de salida) leídas con un único attrgetter
+_STEP_DICT_KEYS = (
+    'id', 'process_id', 'item_id', 'step_order',
+    'item_label', 'item_content', 'item_type', 'item_icon', 'item_is_sensitive',
+    'is_component', 'name_component', 'component_config',
+    'custom_label', 'notes',
+    'is_optional', 'is_enabled', 'wait_for_confirmation',
+    'group_name', 'group_order', 'condition_type', 'added_at'
+)
+_get_step_dict_values = attrgetter(*_STEP_DICT_KEYS)
+
+_PROCESS_DICT_KEYS = (
+    'id', 'name', 'description', 'icon', 'color',
+    'execution_mode', 'delay_between_steps', 'auto_copy_results',
+    'is_pinned', 'pinned_order', 'order_index',
+    'use_count', 'last_used', 'access_count',
+    'is_active', 'is_archived',
+    'created_at', 'updated_at', 'tags', 'category'
+)
+_get_process_dict_values = attrgetter(*_PROCESS_DICT_KEYS)
+
+_PROCESS_DATETIME_KEYS = ('last_used', 'created_at', 'updated_at')
+
+
+@dataclass(slots=True)
 class ProcessStep:
     """Representa un paso individual en un proceso"""
 
@@ -58,53 +129,41 @@ class ProcessStep:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization"""
-        return {
-            'id': self.id,
-            'process_id': self.process_id,
-            'item_id': self.item_id,
-            'step_order': self.step_order,
-            'item_label': self.item_label,
-            'item_content': self.item_content,
-            'item_type': self.item_type,
-            'item_icon': self.item_icon,
-            'item_is_sensitive': self.item_is_sensitive,
-            'is_component': self.is_component,
-            'name_component': self.name_component,
-            'component_config': self.component_config,
-            'custom_label': self.custom_label,
-            'notes': self.notes,
-            'is_optional': self.is_optional,
-            'is_enabled': self.is_enabled,
-            'wait_for_confirmation': self.wait_for_confirmation,
-            'group_name': self.group_name,
-            'group_order': self.group_order,
-            'condition_type': self.condition_type,
-            'added_at': self.added_at.isoformat() if self.added_at else None
-        }
+        result = dict(zip(_STEP_DICT_KEYS, _get_step_dict_values(self)))
+        result['added_at'] = self.added_at.isoformat() if self.added_at else None
+        return result
+
+    def to_row(self, process_id: Optional[int] = None) -> tuple:
+        """
+        Convert to a parameter tuple for DBManager.add_process_steps_bulk()
+
+        Args:
+            process_id: Owning process ID (defaults to self.process_id)
+
+        Returns:
+            Tuple in process_items insert-column order
+        """
+        return (
+            process_id if process_id is not None else self.process_id,
+            self.item_id,
+            self.step_order,
+            self.custom_label,
+            self.is_optional,
+            self.is_enabled,
+            self.wait_for_confirmation,
+            self.notes,
+            self.group_name
+        )
 
     @classmethod
     def from_dict(cls, data: dict) -> 'ProcessStep':
         """Create ProcessStep from dictionary"""
         # Parse datetime if present
-        added_at = None
-        if data.get('added_at'):
-            try:
-                if isinstance(data['added_at'], str):
-                    # Try ISO format first
-                    if 'T' in data['added_at']:
-                        added_at = datetime.fromisoformat(data['added_at'].replace('Z', '+00:00'))
-                    else:
-                        # SQLite format
-                        added_at = datetime.strptime(data['added_at'], '%Y-%m-%d %H:%M:%S')
-                elif isinstance(data['added_at'], datetime):
-                    added_at = data['added_at']
-            except (ValueError, TypeError):
-                pass
+        added_at = _parse_datetime(data.get('added_at'))
 
         # Parse component_config if it's a JSON string
         component_config = data.get('component_config', {})
         if isinstance(component_config, str):
-            import json
             try:
                 component_config = json.loads(component_config)
             except json.JSONDecodeError:
@@ -134,8 +193,43 @@ class ProcessStep:
             added_at=added_at
         )
 
+    @classmethod
+    def from_row(cls, row: tuple) -> 'ProcessStep':
+        """
+        Create ProcessStep from a DBManager.get_process_step_rows() tuple
+
+        Positional counterpart of from_dict: columns are read by offset
+        instead of per-key dict lookups.
+        """
+        (step_id, process_id, item_id, step_order,
+         item_label, item_content, item_type, item_icon, item_is_sensitive,
+         custom_label, notes,
+         is_optional, is_enabled, wait_for_confirmation,
+         group_name, group_order, condition_type, added_at) = row
+
+        return cls(
+            id=step_id,
+            process_id=process_id,
+            item_id=item_id,
+            step_order=step_order,
+            item_label=item_label,
+            item_content=item_content,
+            item_type=item_type,
+            item_icon=item_icon,
+            item_is_sensitive=bool(item_is_sensitive),
+            custom_label=custom_label,
+            notes=notes,
+            is_optional=bool(is_optional),
+            is_enabled=bool(is_enabled),
+            wait_for_confirmation=bool(wait_for_confirmation),
+            group_name=group_name,
+            group_order=group_order,
+            condition_type=condition_type,
+            added_at=_parse_datetime(added_at)
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class Process:
     """Modelo de datos para Proceso"""
 
@@ -226,28 +320,11 @@ class Process:
         Returns:
             Dictionary representation
         """
-        result = {
-            'id': self.id,
-            'name': self.name,
-            'description': self.description,
-            'icon': self.icon,
-            'color': self.color,
-            'execution_mode': self.execution_mode,
-            'delay_between_steps': self.delay_between_steps,
-            'auto_copy_results': self.auto_copy_results,
-            'is_pinned': self.is_pinned,
-            'pinned_order': self.pinned_order,
-            'order_index': self.order_index,
-            'use_count': self.use_count,
-            'last_used': self.last_used.isoformat() if self.last_used else None,
-            'access_count': self.access_count,
-            'is_active': self.is_active,
-            'is_archived': self.is_archived,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'tags': ','.join(self.tags) if self.tags else None,
-            'category': self.category
-        }
+        result = dict(zip(_PROCESS_DICT_KEYS, _get_process_dict_values(self)))
+        for key in _PROCESS_DATETIME_KEYS:
+            value = result[key]
+            result[key] = value.isoformat() if value else None
+        result['tags'] = dump_tags(self.tags)
 
         if include_steps:
             result['steps'] = [step.to_dict() for step in self.steps]
@@ -267,53 +344,10 @@ class Process:
             Process instance
         """
         # Parse datetimes
-        created_at = None
-        updated_at = None
-        last_used = None
-
-        if data.get('created_at'):
-            try:
-                if isinstance(data['created_at'], str):
-                    if 'T' in data['created_at']:
-                        created_at = datetime.fromisoformat(data['created_at'].replace('Z', '+00:00'))
-                    else:
-                        created_at = datetime.strptime(data['created_at'], '%Y-%m-%d %H:%M:%S')
-                elif isinstance(data['created_at'], datetime):
-                    created_at = data['created_at']
-            except (ValueError, TypeError):
-                pass
-
-        if data.get('updated_at'):
-            try:
-                if isinstance(data['updated_at'], str):
-                    if 'T' in data['updated_at']:
-                        updated_at = datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00'))
-                    else:
-                        updated_at = datetime.strptime(data['updated_at'], '%Y-%m-%d %H:%M:%S')
-                elif isinstance(data['updated_at'], datetime):
-                    updated_at = data['updated_at']
-            except (ValueError, TypeError):
-                pass
-
-        if data.get('last_used'):
-            try:
-                if isinstance(data['last_used'], str):
-                    if 'T' in data['last_used']:
-                        last_used = datetime.fromisoformat(data['last_used'].replace('Z', '+00:00'))
-                    else:
-                        last_used = datetime.strptime(data['last_used'], '%Y-%m-%d %H:%M:%S')
-                elif isinstance(data['last_used'], datetime):
-                    last_used = data['last_used']
-            except (ValueError, TypeError):
-                pass
+        datetimes = {key: _parse_datetime(data.get(key)) for key in _PROCESS_DATETIME_KEYS}
 
         # Parse tags
-        tags = []
-        if data.get('tags'):
-            if isinstance(data['tags'], str):
-                tags = [tag.strip() for tag in data['tags'].split(',') if tag.strip()]
-            elif isinstance(data['tags'], list):
-                tags = data['tags']
+        tags = _parse_tags(data.get('tags'))
 
         # Create process
         process = cls(
@@ -329,14 +363,12 @@ class Process:
             pinned_order=data.get('pinned_order', 0),
             order_index=data.get('order_index', 0),
             use_count=data.get('use_count', 0),
-            last_used=last_used,
             access_count=data.get('access_count', 0),
             is_active=bool(data.get('is_active', True)),
             is_archived=bool(data.get('is_archived', False)),
-            created_at=created_at,
-            updated_at=updated_at,
             tags=tags,
-            category=data.get('category')
+            category=data.get('category'),
+            **datetimes
         )
 
         # Add steps if provided
@@ -3,27 +3,148 @@
 Thumbnail Cache Manager
 
 Sistema de caché multinivel para thumbnails de imágenes:
-- Caché en memoria (LRU) para acceso ultra-rápido
-- Caché en disco para persistencia entre sesiones
-- Generación automática de thumbnails con Pillow
+- Caché en memoria (QPixmapCache de Qt, LRU por bytes) para acceso ultra-rápido
+- Caché en disco (un único archivo SQLite con blobs) para persistencia entre sesiones
+- Generación automática de thumbnails con Pillow (o Pillow-SIMD si está instalado)
 """
 
+import os
 import logging
 import hashlib
+import shutil
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from functools import lru_cache
+import PIL
 from PIL import Image
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap, QPixmapCache, QImageReader, QImageWriter
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Pillow-SIMD publica versiones '.postN'; mismo API, resize vectorizado (SSE4/AVX2)
+PILLOW_SIMD = '.post' in PIL.__version__
+
+# Workers para preload: decode/resize de Pillow libera el GIL
+PRELOAD_MAX_WORKERS = min(8, os.cpu_count() or 4)
+
+# Subdirectorios del caché legacy (un archivo por thumbnail)
+_LEGACY_SIZE_DIRS = ('small', 'medium', 'large')
+
+# Versión del esquema de thumbs.db (si cambia, el caché se recrea vacío)
+_CACHE_SCHEMA_VERSION = 3
+
+# mtime_ns / file_size de la imagen original invalidan el thumbnail si el archivo cambia;
+# last_access (epoch) ordena la expulsión LRU cuando se supera el límite de tamaño
+_SQL_CREATE_THUMBNAILS = """
+    CREATE TABLE IF NOT EXISTS thumbnails (
+        key TEXT NOT NULL,
+        size TEXT NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        file_size INTEGER NOT NULL,
+        last_access INTEGER NOT NULL,
+        data BLOB NOT NULL,
+        PRIMARY KEY (key, size)
+    ) WITHOUT ROWID
+"""
+_SQL_CREATE_THUMBNAILS_ACCESS_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_thumbnails_last_access ON thumbnails(last_access)
+"""
+_SQL_SELECT_THUMBNAIL = """
+    SELECT data FROM thumbnails
+    WHERE key = ? AND size = ? AND mtime_ns = ? AND file_size = ?
+"""
+_SQL_THUMBNAIL_EXISTS = """
+    SELECT 1 FROM thumbnails
+    WHERE key = ? AND size = ? AND mtime_ns = ? AND file_size = ?
+"""
+_SQL_INSERT_THUMBNAIL = """
+    INSERT OR REPLACE INTO thumbnails (key, size, mtime_ns, file_size, last_access, data)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_TOUCH_THUMBNAIL = "UPDATE thumbnails SET last_access = ? WHERE key = ? AND size = ?"
+_SQL_THUMBNAILS_BY_ACCESS = """
+    SELECT key, size, LENGTH(data) FROM thumbnails ORDER BY last_access
+"""
+_SQL_DELETE_THUMBNAIL = "DELETE FROM thumbnails WHERE key = ? AND size = ?"
+_SQL_DELETE_ALL_THUMBNAILS = "DELETE FROM thumbnails"
+_SQL_THUMBNAILS_SIZE = "SELECT COALESCE(SUM(LENGTH(data)), 0) FROM thumbnails"
+
+
+def _webp_supported() -> bool:
+    """Verificar que Pillow y Qt (plugin qwebp) pueden leer y escribir WebP"""
+    from PIL import features
+    return (features.check('webp')
+            and b'webp' in QImageReader.supportedImageFormats()
+            and b'webp' in QImageWriter.supportedImageFormats())
+
+
+@lru_cache(maxsize=4096)
+def _path_hash(image_path: str) -> str:
+    """
+    Hash (no criptográfico) de la ruta usado como clave del caché en disco
+
+    Usa xxh3 si xxhash está instalado, si no blake2b de stdlib. Memoizado:
+    la galería pide las mismas rutas constantemente.
+    """
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(image_path)
+    return hashlib.blake2b(image_path.encode(), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _memory_key(image_path: str, size: Tuple[int, int]) -> str:
+    """
+    Clave de QPixmapCache para (ruta, tamaño)
+
+    QPixmapCache solo acepta str: la clave se formatea e interna una vez
+    por imagen y tamaño en lugar de en cada búsqueda.
+    """
+    return sys.intern(f"{image_path}\0{size[0]}x{size[1]}")
+
+
+class _ThumbnailSignals(QObject):
+    """Señales de los workers de thumbnails (se entregan en el hilo de la GUI)"""
+
+    # request_key (image_path, size, disk_key), bytes codificados, QImage
+    rendered = pyqtSignal(object, object, object)
+
+
+class _ThumbnailTask(QRunnable):
+    """Genera un thumbnail en QThreadPool: Pillow + QImage, sin QPixmap"""
+
+    def __init__(self, cache: 'ThumbnailCache', request_key: tuple):
+        super().__init__()
+        self._cache = cache
+        self._request_key = request_key
+
+    def run(self):
+        image_path, size, _ = self._request_key
+        data = self._cache._render_thumbnail(image_path, size)
+        image = None
+        if data is not None:
+            # QImage (a diferencia de QPixmap) puede crearse fuera del hilo de la GUI
+            image = QImage.fromData(data)
+        self._cache._async_signals.rendered.emit(self._request_key, data, image)
+
 
 class ThumbnailCache:
     """
     Sistema de caché de thumbnails con dos niveles:
-    1. Memoria (LRU cache) - 100 thumbnails
-    2. Disco (temp/thumbnails/) - Persistente
+    1. Memoria (QPixmapCache) - 100 MB
+    2. Disco (temp/thumbnails/thumbs.db) - Persistente
 
     Tamaños de thumbnail:
     - SMALL: 80x80 px (para grid compacto)
@@ -36,6 +157,34 @@ class ThumbnailCache:
     SIZE_MEDIUM = (150, 150)
     SIZE_LARGE = (300, 300)
 
+    # Etiqueta de cada tamaño estándar en la clave del caché en disco
+    _SIZE_LABELS = {
+        SIZE_SMALL: 'small',
+        SIZE_MEDIUM: 'medium',
+        SIZE_LARGE: 'large'
+    }
+
+    # Límite mínimo de QPixmapCache (KB); el caché es global a la aplicación
+    MEMORY_CACHE_LIMIT_KB = 100 * 1024
+
+    # Claves de thumbnails insertadas en QPixmapCache (por todas las instancias,
+    # como el propio caché): clear_memory_cache() borra solo estas y no los
+    # pixmaps de estilos/iconos de Qt. Solo se usa desde el hilo de la GUI
+    _memory_keys: set = set()
+
+    # Límite del caché en disco: al superarlo se expulsa (LRU) hasta el 80%
+    MAX_DISK_BYTES = 500 * 1024 * 1024
+    DISK_EVICTION_TARGET = 0.8
+
+    # Cada cuántos thumbnails generados se verifica el límite de disco
+    DISK_CHECK_INTERVAL = 100
+
+    # Accesos a disco acumulados antes de escribir last_access en lote
+    ACCESS_FLUSH_BATCH = 50
+
+    # JPEG original ya dentro del tamaño pedido: se guarda tal cual si no supera esto
+    SOURCE_COPY_MAX_BYTES = 128 * 1024
+
     def __init__(self, cache_dir: Optional[Path] = None):
         """
         Inicializar caché de thumbnails
@@ -48,15 +197,42 @@ class ThumbnailCache:
             self.cache_dir = Path(cache_dir)
         else:
             # Por defecto: temp/thumbnails/ en directorio de la app
-            import sys
             if getattr(sys, 'frozen', False):
                 base_dir = Path(sys.executable).parent
             else:
                 base_dir = Path(__file__).parent.parent.parent
             self.cache_dir = base_dir / 'temp' / 'thumbnails'
 
-        # Crear directorios si no existen
-        self._ensure_cache_dirs()
+        # Base de datos de thumbnails (una conexión por hilo)
+        self.db_path = self.cache_dir / 'thumbs.db'
+        self._local = threading.local()
+        self._ensure_cache_store()
+
+        # Caché en memoria: QPixmapCache (C++, LRU acotado por bytes).
+        # Solo se usa desde el hilo de la GUI.
+        if QPixmapCache.cacheLimit() < self.MEMORY_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(self.MEMORY_CACHE_LIMIT_KB)
+
+        # Claves de disco que ya se sabe que existen (evita consultas)
+        self._disk_exists: set = set()
+
+        # Límite de disco y expulsión en background
+        self.max_disk_bytes = self.MAX_DISK_BYTES
+        self._misses_since_gc = 0
+        self._gc_thread: Optional[threading.Thread] = None
+
+        # (key, size) -> último acceso, pendientes de escribir en la base de datos
+        self._pending_access: dict = {}
+
+        # Generación asíncrona: señales (creadas al primer uso) y callbacks por petición
+        self._async_signals: Optional[_ThumbnailSignals] = None
+        self._pending_async: Dict[tuple, List[Callable]] = {}
+
+        # Formato de caché: WebP (~30% más pequeño) o JPEG si no hay soporte
+        if _webp_supported():
+            self._format, self._quality = 'WEBP', 80
+        else:
+            self._format, self._quality = 'JPEG', 85
 
         # Estadísticas
         self.stats = {
@@ -66,52 +242,75 @@ class ThumbnailCache:
             'generated': 0
         }
 
+        if not PILLOW_SIMD:
+            logger.info(f"Using stock Pillow {PIL.__version__}; install pillow-simd for faster thumbnail resizing")
+
         logger.info(f"ThumbnailCache initialized: {self.cache_dir}")
 
-    def _ensure_cache_dirs(self) -> None:
-        """Crear directorios de caché si no existen"""
+    def _get_connection(self) -> sqlite3.Connection:
+        """Obtener la conexión SQLite del hilo actual (se crea al primer uso)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _ensure_cache_store(self) -> None:
+        """Crear directorio y tabla de caché; eliminar el caché legacy por archivos"""
         try:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-            # Subdirectorios por tamaño
-            (self.cache_dir / 'small').mkdir(exist_ok=True)
-            (self.cache_dir / 'medium').mkdir(exist_ok=True)
-            (self.cache_dir / 'large').mkdir(exist_ok=True)
+            conn = self._get_connection()
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _CACHE_SCHEMA_VERSION:
+                # Esquema anterior: es solo caché, se descarta y se regenera
+                conn.execute("DROP TABLE IF EXISTS thumbnails")
+                conn.execute(f"PRAGMA user_version = {_CACHE_SCHEMA_VERSION}")
+            conn.execute(_SQL_CREATE_THUMBNAILS)
+            conn.execute(_SQL_CREATE_THUMBNAILS_ACCESS_INDEX)
 
-            logger.debug("Cache directories created")
+            self._remove_legacy_dirs()
 
-        except Exception as e:
-            logger.error(f"Error creating cache directories: {e}")
+            logger.debug("Cache store ready")
 
-    def _get_cache_path(self, image_path: str, size: Tuple[int, int]) -> Path:
+        except Exception as e:
+            logger.error(f"Error creating cache store: {e}")
+
+    def _remove_legacy_dirs(self) -> None:
+        """Eliminar subdirectorios small/medium/large del caché por archivos"""
+        for size_dir in _LEGACY_SIZE_DIRS:
+            legacy_dir = self.cache_dir / size_dir
+            if legacy_dir.is_dir():
+                shutil.rmtree(legacy_dir, ignore_errors=True)
+                logger.info(f"Removed legacy thumbnail directory: {legacy_dir}")
+
+    def _get_cache_key(self, image_path: str, size: Tuple[int, int],
+                       source_stat: os.stat_result) -> Tuple[str, str, int, int]:
         """
-        Obtener ruta de caché para thumbnail
+        Obtener clave de caché en disco para thumbnail
 
         Args:
             image_path: Ruta de imagen original
             size: Tamaño del thumbnail
+            source_stat: os.stat() de la imagen original
 
         Returns:
-            Path al archivo de caché
+            Tupla (hash de la ruta, etiqueta de tamaño, mtime_ns, tamaño en bytes)
         """
-        # Hash del path de la imagen (para nombre único)
-        path_hash = hashlib.md5(image_path.encode()).hexdigest()
+        # Hash del path de la imagen (para clave única)
+        path_hash = _path_hash(image_path)
 
-        # Determinar subdirectorio por tamaño
-        if size == self.SIZE_SMALL:
-            subdir = 'small'
-        elif size == self.SIZE_MEDIUM:
-            subdir = 'medium'
-        else:
-            subdir = 'large'
+        # Etiqueta por tamaño (tamaños no estándar: 'WxH', sin colisionar con 'large')
+        size_label = self._SIZE_LABELS.get(size)
+        if size_label is None:
+            size_label = f"{size[0]}x{size[1]}"
 
-        # Ruta completa: temp/thumbnails/{size}/{hash}.jpg
-        return self.cache_dir / subdir / f"{path_hash}.jpg"
+        return path_hash, size_label, source_stat.st_mtime_ns, source_stat.st_size
 
-    @lru_cache(maxsize=100)
     def _load_from_memory(self, cache_key: str) -> Optional[QPixmap]:
         """
-        Caché en memoria usando LRU
+        Buscar thumbnail en caché de memoria (QPixmapCache)
 
         Args:
             cache_key: Clave única (path + size)
@@ -119,11 +318,10 @@ class ThumbnailCache:
         Returns:
             QPixmap o None si no está en caché
         """
-        # Esta función es solo un wrapper para el decorador lru_cache
-        # El verdadero caché está en el decorador
-        return None
+        return QPixmapCache.find(cache_key)
 
-    def get_thumbnail(self, image_path: str, size: Tuple[int, int] = None) -> Optional[QPixmap]:
+    def get_thumbnail(self, image_path: str, size: Tuple[int, int] = None,
+                      verify_source: bool = False) -> Optional[QPixmap]:
         """
         Obtener thumbnail de imagen (desde caché o generando)
 
@@ -136,6 +334,8 @@ class ThumbnailCache:
         Args:
             image_path: Ruta completa a imagen original
             size: Tupla (ancho, alto) del thumbnail (default: MEDIUM)
+            verify_source: Verificar que la imagen original existe antes de
+                consultar los cachés (por defecto solo se verifica al generar)
 
         Returns:
             QPixmap con el thumbnail o None si falla
@@ -147,50 +347,54 @@ class ThumbnailCache:
         if size is None:
             size = self.SIZE_MEDIUM
 
-        # Verificar que archivo existe
-        img_path = Path(image_path)
-        if not img_path.exists():
+        # Verificar que archivo existe (opcional: los llamadores suelen
+        # pasar rutas recién enumeradas)
+        if verify_source and not os.path.isfile(image_path):
             logger.warning(f"Image file not found: {image_path}")
             return None
 
         # 1. Intentar cargar desde memoria
-        cache_key = f"{image_path}_{size[0]}x{size[1]}"
+        cache_key = _memory_key(image_path, size)
         memory_result = self._load_from_memory(cache_key)
-        if memory_result:
+        if memory_result is not None:
             self.stats['hits'] += 1
             return memory_result
 
-        # 2. Intentar cargar desde disco
-        cache_path = self._get_cache_path(image_path, size)
-        if cache_path.exists():
-            try:
-                pixmap = QPixmap(str(cache_path))
-                if not pixmap.isNull():
+        # 2. Intentar cargar desde disco (la clave incluye mtime/tamaño del original)
+        try:
+            source_stat = os.stat(image_path)
+        except OSError:
+            logger.warning(f"Image file not found: {image_path}")
+            return None
+
+        disk_key = self._get_cache_key(image_path, size, source_stat)
+        try:
+            data = self._load_from_disk(disk_key)
+            if data is not None:
+                pixmap = self._pixmap_from_bytes(data)
+                if pixmap is None:
+                    # Blob corrupto: descartarlo para regenerarlo
+                    self._delete_from_disk(disk_key)
+                else:
                     # Guardar en caché de memoria para próxima vez
                     self._cache_in_memory(cache_key, pixmap)
                     self.stats['disk_hits'] += 1
-                    logger.debug(f"Thumbnail loaded from disk: {cache_path.name}")
+                    logger.debug(f"Thumbnail loaded from disk: {os.path.basename(image_path)}")
                     return pixmap
-            except Exception as e:
-                logger.error(f"Error loading cached thumbnail: {e}")
+        except Exception as e:
+            logger.error(f"Error loading cached thumbnail: {e}")
 
-        # 3. Generar nuevo thumbnail
-        self.stats['misses'] += 1
-        thumbnail = self._generate_thumbnail(image_path, size)
+        # 3. Generar nuevo thumbnail (guardado en disco y memoria)
+        thumbnail, data = self._generate_thumbnail(image_path, size)
+        thumbnail = self._store_thumbnail(image_path, size, disk_key, thumbnail, data)
 
         if thumbnail:
-            # Guardar en disco
-            self._save_to_disk(thumbnail, cache_path)
-
-            # Guardar en memoria
-            self._cache_in_memory(cache_key, thumbnail)
-
-            self.stats['generated'] += 1
-            logger.debug(f"Thumbnail generated: {img_path.name}")
+            logger.debug(f"Thumbnail generated: {os.path.basename(image_path)}")
 
         return thumbnail
 
-    def _generate_thumbnail(self, image_path: str, size: Tuple[int, int]) -> Optional[QPixmap]:
+    def _generate_thumbnail(self, image_path: str,
+                            size: Tuple[int, int]) -> Tuple[Optional[QPixmap], Optional[bytes]]:
         """
         Generar thumbnail desde imagen original
 
@@ -199,70 +403,426 @@ class ThumbnailCache:
             size: Tamaño deseado (ancho, alto)
 
         Returns:
-            QPixmap con thumbnail o None si falla
+            Tupla (QPixmap, bytes codificados); (None, None) si falla
+        """
+        data = self._render_thumbnail(image_path, size)
+        if data is None:
+            return None, None
+        return self._pixmap_from_bytes(data), data
+
+    def _render_thumbnail(self, image_path: str, size: Tuple[int, int]) -> Optional[bytes]:
         """
+        Decodificar, redimensionar y codificar thumbnail (WebP o JPEG)
+
+        Solo usa Pillow (sin objetos Qt), por lo que es seguro llamarlo
+        desde hilos worker.
+
+        Args:
+            image_path: Ruta a imagen original
+            size: Tamaño deseado (ancho, alto)
+
+        Returns:
+            Bytes codificados del thumbnail o None si falla
+        """
+        return self._render_thumbnails(image_path, [size]).get(size)
+
+    def _render_thumbnails(self, image_path: str,
+                           sizes: List[Tuple[int, int]]) -> Dict[Tuple[int, int], bytes]:
+        """
+        Generar varios tamaños de thumbnail con un único decode
+
+        La imagen se abre y normaliza una vez; cada tamaño se reduce a
+        partir del anterior (de mayor a menor). Si la imagen ya cabe en el
+        tamaño pedido no se redimensiona, y un JPEG pequeño se guarda con
+        sus bytes originales (sin decode/encode). Seguro en hilos worker.
+
+        Args:
+            image_path: Ruta a imagen original
+            sizes: Tamaños deseados (ancho, alto)
+
+        Returns:
+            Dict tamaño -> bytes codificados (vacío si falla)
+        """
+        results = {}
+        if not sizes:
+            return results
+
+        ordered_sizes = sorted(set(sizes), key=lambda s: s[0] * s[1], reverse=True)
+        largest = ordered_sizes[0]
+
         try:
             # Abrir imagen con Pillow
             with Image.open(image_path) as img:
-                # Convertir a RGB si es necesario (para PNGs con transparencia)
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    # Crear fondo blanco
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                    img = background
-                elif img.mode != 'RGB':
+                source_width, source_height = img.size
+
+                # JPEG RGB/L pequeño: sus bytes sirven directamente como thumbnail
+                copy_source = (
+                    img.format == 'JPEG'
+                    and img.mode in ('RGB', 'L')
+                    and os.path.getsize(image_path) <= self.SOURCE_COPY_MAX_BYTES
+                )
+
+                # JPEG: decodificar directamente a escala 1/2..1/8 (DCT) cerca del tamaño final
+                if img.format == 'JPEG':
+                    img.draft('RGB', (largest[0] * 2, largest[1] * 2))
+
+                # Paleta / modos sin soporte LANCZOS: convertir antes de reducir
+                # (RGBA solo si la paleta tiene transparencia)
+                if img.mode == 'P':
+                    img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+                elif img.mode not in ('RGB', 'RGBA', 'LA', 'L'):
                     img = img.convert('RGB')
 
-                # Crear thumbnail (mantiene aspect ratio)
-                img.thumbnail(size, Image.Resampling.LANCZOS)
+                current = img
+                source_bytes = None
+                for size in ordered_sizes:
+                    if source_width <= size[0] and source_height <= size[1]:
+                        # Ya cabe: sin resize
+                        if copy_source:
+                            if source_bytes is None:
+                                with open(image_path, 'rb') as source_file:
+                                    source_bytes = source_file.read()
+                            results[size] = source_bytes
+                        else:
+                            results[size] = self._encode_thumbnail(current)
+                        continue
+
+                    # Crear thumbnail (mantiene aspect ratio).
+                    # reducing_gap: reducción previa por bloques y LANCZOS solo sobre la imagen reducida
+                    current = current.copy()
+                    current.thumbnail(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+                    results[size] = self._encode_thumbnail(current)
 
-                # Guardar temporalmente para cargar en QPixmap
-                import tempfile
-                with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp:
-                    tmp_path = tmp.name
-                    img.save(tmp_path, 'JPEG', quality=85)
+        except Exception as e:
+            logger.error(f"Error generating thumbnail for {image_path}: {e}")
+            return {}
+
+        return results
+
+    def _encode_thumbnail(self, img: Image.Image) -> bytes:
+        """Aplanar transparencia sobre blanco y codificar en el formato de caché"""
+        # Transparencia sobre fondo blanco, ya al tamaño del thumbnail
+        if img.mode in ('RGBA', 'LA'):
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            background.paste(img, mask=img.getchannel('A'))
+            img = background
+        elif img.mode != 'RGB':
+            img = img.convert('RGB')
+
+        # Codificar en memoria (sin archivo temporal)
+        buffer = BytesIO()
+        if self._format == 'WEBP':
+            img.save(buffer, 'WEBP', quality=self._quality, method=4)
+        else:
+            img.save(buffer, 'JPEG', quality=self._quality)
+        return buffer.getvalue()
 
-                # Cargar en QPixmap
-                pixmap = QPixmap(tmp_path)
+    def _store_rendered(self, image_path: str, size: Tuple[int, int],
+                        disk_key: Tuple[str, str, int, int],
+                        data: Optional[bytes]) -> Optional[QPixmap]:
+        """
+        Cargar bytes generados en QPixmap y guardarlo en disco y memoria
 
-                # Eliminar archivo temporal
-                Path(tmp_path).unlink(missing_ok=True)
+        Debe llamarse en el hilo de la GUI.
 
-                return pixmap if not pixmap.isNull() else None
+        Returns:
+            QPixmap o None si la generación falló
+        """
+        thumbnail = self._pixmap_from_bytes(data) if data is not None else None
+        return self._store_thumbnail(image_path, size, disk_key, thumbnail, data)
 
-        except Exception as e:
-            logger.error(f"Error generating thumbnail for {image_path}: {e}")
+    def _store_thumbnail(self, image_path: str, size: Tuple[int, int],
+                         disk_key: Tuple[str, str, int, int],
+                         thumbnail: Optional[QPixmap],
+                         data: Optional[bytes]) -> Optional[QPixmap]:
+        """
+        Guardar thumbnail recién generado en disco y memoria (hilo de la GUI)
+
+        data son los bytes ya codificados del thumbnail; se escriben tal
+        cual en disco, sin volver a codificar el QPixmap.
+        """
+        self.stats['misses'] += 1
+        if thumbnail is None:
             return None
+        self._save_to_disk(data, disk_key)
+        self._cache_in_memory(_memory_key(image_path, size), thumbnail)
+        self.stats['generated'] += 1
+        return thumbnail
+
+    def get_thumbnail_async(self, image_path: str, size: Tuple[int, int] = None,
+                            callback: Callable[[Optional[QPixmap]], None] = None) -> None:
+        """
+        Obtener thumbnail sin bloquear la GUI
+
+        Los aciertos de memoria/disco llaman al callback inmediatamente.
+        En un fallo, el decode/resize se ejecuta en QThreadPool y el
+        QPixmap se crea en el hilo de la GUI (conexión en cola) antes de
+        llamar al callback. Peticiones repetidas de la misma imagen y
+        tamaño comparten una única generación.
+
+        Args:
+            image_path: Ruta completa a imagen original
+            size: Tupla (ancho, alto) del thumbnail (default: MEDIUM)
+            callback: Función que recibe el QPixmap (o None si falla)
+        """
+        if size is None:
+            size = self.SIZE_MEDIUM
+
+        def deliver(pixmap):
+            if callback is not None:
+                try:
+                    callback(pixmap)
+                except Exception as e:
+                    logger.error(f"Error in thumbnail callback for {image_path}: {e}")
+
+        if not image_path:
+            deliver(None)
+            return
+
+        # Aciertos en caché: respuesta inmediata
+        pixmap = self._load_from_memory(_memory_key(image_path, size))
+        if pixmap is not None:
+            self.stats['hits'] += 1
+            deliver(pixmap)
+            return
 
-    def _save_to_disk(self, pixmap: QPixmap, cache_path: Path) -> bool:
+        try:
+            source_stat = os.stat(image_path)
+        except OSError:
+            logger.warning(f"Image file not found: {image_path}")
+            deliver(None)
+            return
+
+        disk_key = self._get_cache_key(image_path, size, source_stat)
+        if self._disk_cache_exists(disk_key):
+            deliver(self.get_thumbnail(image_path, size))
+            return
+
+        # Fallo: generar en background (una sola tarea por imagen y tamaño)
+        request_key = (image_path, size, disk_key)
+        callbacks = self._pending_async.get(request_key)
+        if callbacks is not None:
+            callbacks.append(deliver)
+            return
+        self._pending_async[request_key] = [deliver]
+
+        if self._async_signals is None:
+            self._async_signals = _ThumbnailSignals()
+            self._async_signals.rendered.connect(
+                self._on_async_rendered, Qt.ConnectionType.QueuedConnection
+            )
+
+        QThreadPool.globalInstance().start(_ThumbnailTask(self, request_key))
+
+    def _on_async_rendered(self, request_key: tuple, data: Optional[bytes],
+                           image: Optional[QImage]) -> None:
+        """Recibir thumbnail de un worker (hilo de la GUI) y entregarlo"""
+        image_path, size, disk_key = request_key
+        callbacks = self._pending_async.pop(request_key, [])
+
+        thumbnail = None
+        if image is not None and not image.isNull():
+            thumbnail = QPixmap.fromImage(image)
+        thumbnail = self._store_thumbnail(image_path, size, disk_key, thumbnail, data)
+
+        for deliver in callbacks:
+            deliver(thumbnail)
+
+    def generate_multi(self, image_path: str,
+                       sizes: List[Tuple[int, int]]) -> Dict[Tuple[int, int], QPixmap]:
+        """
+        Obtener varios tamaños de thumbnail de una imagen decodificándola una sola vez
+
+        Los tamaños ya cacheados se sirven desde memoria/disco; el resto se
+        genera junto (p.ej. grid + preview de la misma imagen).
+
+        Args:
+            image_path: Ruta completa a imagen original
+            sizes: Lista de tamaños (ancho, alto)
+
+        Returns:
+            Dict tamaño -> QPixmap (omite tamaños que fallaron)
+        """
+        results = {}
+        try:
+            source_stat = os.stat(image_path)
+        except OSError:
+            logger.warning(f"Image file not found: {image_path}")
+            return results
+
+        # Separar tamaños ya cacheados de los que hay que generar
+        pending = []
+        for size in sizes:
+            disk_key = self._get_cache_key(image_path, size, source_stat)
+            if (QPixmapCache.find(_memory_key(image_path, size)) is not None
+                    or self._disk_cache_exists(disk_key)):
+                pixmap = self.get_thumbnail(image_path, size)
+                if pixmap is not None:
+                    results[size] = pixmap
+                    continue
+            pending.append((size, disk_key))
+
+        if pending:
+            rendered = self._render_thumbnails(image_path, [size for size, _ in pending])
+            for size, disk_key in pending:
+                pixmap = self._store_rendered(image_path, size, disk_key, rendered.get(size))
+                if pixmap is not None:
+                    results[size] = pixmap
+
+        return results
+
+    def _pixmap_from_bytes(self, data: bytes) -> Optional[QPixmap]:
+        """
+        Cargar QPixmap desde bytes codificados (solo en el hilo de la GUI)
+
+        Sin formato explícito: el caché puede contener WebP/JPEG codificados
+        o bytes JPEG originales.
+        """
+        pixmap = QPixmap()
+        pixmap.loadFromData(data)
+        return pixmap if not pixmap.isNull() else None
+
+    def _load_from_disk(self, disk_key: Tuple[str, str, int, int]) -> Optional[bytes]:
+        """
+        Leer thumbnail codificado desde la base de datos de caché
+
+        Args:
+            disk_key: Clave de _get_cache_key
+
+        Returns:
+            Bytes del thumbnail o None si no está en caché
+        """
+        row = self._get_connection().execute(_SQL_SELECT_THUMBNAIL, disk_key).fetchone()
+        if row is None:
+            self._disk_exists.discard(disk_key)
+            return None
+        self._disk_exists.add(disk_key)
+        self._record_access(disk_key)
+        return row[0]
+
+    def _disk_cache_exists(self, disk_key: Tuple[str, str, int, int]) -> bool:
+        """
+        Verificar si existe el thumbnail en disco
+
+        Los resultados positivos se recuerdan en _disk_exists; solo se
+        consulta la base de datos para claves aún no vistas.
+        """
+        if disk_key in self._disk_exists:
+            return True
+        if self._get_connection().execute(_SQL_THUMBNAIL_EXISTS, disk_key).fetchone():
+            self._disk_exists.add(disk_key)
+            return True
+        return False
+
+    def _delete_from_disk(self, disk_key: Tuple[str, str, int, int]) -> None:
+        """Eliminar un thumbnail de la base de datos de caché"""
+        self._disk_exists.discard(disk_key)
+        self._get_connection().execute(_SQL_DELETE_THUMBNAIL, disk_key[:2])
+
+    def _save_to_disk(self, data: bytes, disk_key: Tuple[str, str, int, int]) -> bool:
         """
         Guardar thumbnail en caché de disco
 
         Args:
-            pixmap: QPixmap a guardar
-            cache_path: Ruta donde guardar
+            data: Thumbnail ya codificado (formato de caché)
+            disk_key: Clave de _get_cache_key (un thumbnail anterior de la
+                misma imagen y tamaño se reemplaza)
 
         Returns:
             True si se guardó exitosamente
         """
         try:
-            # Asegurar que el directorio padre existe
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Guardar como JPEG (mejor compresión)
-            success = pixmap.save(str(cache_path), 'JPEG', quality=85)
+            # Ya guardado (p.ej. generación duplicada): evitar escribir de nuevo
+            if disk_key in self._disk_exists:
+                return True
 
-            if success:
-                logger.debug(f"Thumbnail saved to disk: {cache_path.name}")
+            self._get_connection().execute(
+                _SQL_INSERT_THUMBNAIL, (*disk_key, int(time.time()), data)
+            )
+            self._disk_exists.add(disk_key)
+            self._maybe_enforce_disk_limit()
+            logger.debug(f"Thumbnail saved to disk: {disk_key[0]} ({disk_key[1]})")
 
-            return success
+            return True
 
         except Exception as e:
             logger.error(f"Error saving thumbnail to disk: {e}")
             return False
 
+    def _record_access(self, disk_key: Tuple[str, str, int, int]) -> None:
+        """Registrar acceso a un thumbnail en disco (escritura diferida en lote)"""
+        self._pending_access[disk_key[:2]] = int(time.time())
+        if len(self._pending_access) >= self.ACCESS_FLUSH_BATCH:
+            self._flush_access_times()
+
+    def _flush_access_times(self) -> None:
+        """Escribir last_access pendientes con un único executemany"""
+        if not self._pending_access:
+            return
+        rows = [(accessed, key, size) for (key, size), accessed in self._pending_access.items()]
+        self._pending_access.clear()
+        try:
+            conn = self._get_connection()
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany(_SQL_TOUCH_THUMBNAIL, rows)
+        except Exception as e:
+            logger.error(f"Error updating thumbnail access times: {e}")
+
+    def _maybe_enforce_disk_limit(self) -> None:
+        """Lanzar la expulsión en background cada DISK_CHECK_INTERVAL thumbnails nuevos"""
+        self._misses_since_gc += 1
+        if self._misses_since_gc < self.DISK_CHECK_INTERVAL:
+            return
+        if self._gc_thread is not None and self._gc_thread.is_alive():
+            return
+
+        self._misses_since_gc = 0
+        self._flush_access_times()
+        self._gc_thread = threading.Thread(
+            target=self.enforce_disk_limit, name='ThumbnailCacheGC', daemon=True
+        )
+        self._gc_thread.start()
+
+    def enforce_disk_limit(self) -> int:
+        """
+        Expulsar thumbnails menos usados si el caché en disco supera max_disk_bytes
+
+        Elimina por last_access ascendente hasta bajar al 80% del límite.
+        Usa la conexión propia del hilo que lo ejecuta.
+
+        Returns:
+            Número de thumbnails eliminados
+        """
+        try:
+            conn = self._get_connection()
+            total_size = conn.execute(_SQL_THUMBNAILS_SIZE).fetchone()[0]
+            if total_size <= self.max_disk_bytes:
+                return 0
+
+            target = int(self.max_disk_bytes * self.DISK_EVICTION_TARGET)
+            victims = []
+            for key, size, data_size in conn.execute(_SQL_THUMBNAILS_BY_ACCESS):
+                if total_size <= target:
+                    break
+                victims.append((key, size))
+                total_size -= data_size
+
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany(_SQL_DELETE_THUMBNAIL, victims)
+            # Olvidar claves expulsadas: se reasigna un set nuevo en vez de
+            # recorrer/mutar el que usa el hilo GUI (se repuebla bajo demanda)
+            if victims:
+                self._disk_exists = set()
+
+            logger.info(f"Disk cache limit enforced: {len(victims)} thumbnails evicted")
+            return len(victims)
+
+        except Exception as e:
+            logger.error(f"Error enforcing disk cache limit: {e}")
+            return 0
+
     def _cache_in_memory(self, cache_key: str, pixmap: QPixmap) -> None:
         """
         Guardar thumbnail en caché de memoria
@@ -271,20 +831,16 @@ class ThumbnailCache:
             cache_key: Clave única
             pixmap: QPixmap a cachear
         """
-        # El LRU cache está en _load_from_memory
-        # Aquí usamos un dict simple adicional para almacenar
-        if not hasattr(self, '_memory_cache'):
-            self._memory_cache = {}
-
-        self._memory_cache[cache_key] = pixmap
+        # QPixmapCache expulsa los menos usados al superar cacheLimit()
+        QPixmapCache.insert(cache_key, pixmap)
+        self._memory_keys.add(cache_key)
 
     def clear_memory_cache(self) -> None:
-        """Limpiar caché en memoria"""
-        if hasattr(self, '_memory_cache'):
-            self._memory_cache.clear()
-
-        # Limpiar LRU cache
-        self._load_from_memory.cache_clear()
+        """Limpiar caché en memoria (solo thumbnails)"""
+        # remove() de una clave ya expulsada por Qt no hace nada
+        for cache_key in self._memory_keys:
+            QPixmapCache.remove(cache_key)
+        self._memory_keys.clear()
 
         logger.info("Memory cache cleared")
 
@@ -293,22 +849,17 @@ class ThumbnailCache:
         Limpiar caché en disco
 
         Returns:
-            Número de archivos eliminados
+            Número de thumbnails eliminados
         """
         deleted_count = 0
+        self._disk_exists.clear()
+        self._pending_access.clear()
 
         try:
-            for size_dir in ['small', 'medium', 'large']:
-                dir_path = self.cache_dir / size_dir
-                if dir_path.exists():
-                    for cache_file in dir_path.glob('*.jpg'):
-                        try:
-                            cache_file.unlink()
-                            deleted_count += 1
-                        except Exception as e:
-                            logger.error(f"Error deleting {cache_file}: {e}")
-
-            logger.info(f"Disk cache cleared: {deleted_count} files deleted")
+            deleted_count = self._get_connection().execute(_SQL_DELETE_ALL_THUMBNAILS).rowcount
+            self._remove_legacy_dirs()
+
+            logger.info(f"Disk cache cleared: {deleted_count} thumbnails deleted")
 
         except Exception as e:
             logger.error(f"Error clearing disk cache: {e}")
@@ -320,7 +871,7 @@ class ThumbnailCache:
         Limpiar todos los cachés (memoria + disco)
 
         Returns:
-            Número de archivos eliminados del disco
+            Número de thumbnails eliminados del disco
         """
         self.clear_memory_cache()
         return self.clear_disk_cache()
@@ -335,11 +886,7 @@ class ThumbnailCache:
         total_size = 0
 
         try:
-            for size_dir in ['small', 'medium', 'large']:
-                dir_path = self.cache_dir / size_dir
-                if dir_path.exists():
-                    for cache_file in dir_path.glob('*.jpg'):
-                        total_size += cache_file.stat().st_size
+            total_size = self._get_connection().execute(_SQL_THUMBNAILS_SIZE).fetchone()[0]
         except Exception as e:
             logger.error(f"Error calculating cache size: {e}")
 
@@ -381,8 +928,29 @@ class ThumbnailCache:
 
         logger.info(f"Preloading {len(image_paths)} thumbnails...")
 
+        # Separar imágenes ya cacheadas en disco de las que hay que generar
+        pending = []
         for img_path in image_paths:
-            # Esto generará y cacheará los thumbnails
-            self.get_thumbnail(img_path, size)
+            if not img_path:
+                continue
+            try:
+                disk_key = self._get_cache_key(img_path, size, os.stat(img_path))
+            except OSError:
+                continue
+            if self._disk_cache_exists(disk_key):
+                # Solo carga desde disco a memoria
+                self.get_thumbnail(img_path, size)
+            else:
+                pending.append((img_path, disk_key))
+
+        if pending:
+            # Decode/resize en paralelo (Pillow); los workers no tocan Qt ni stats
+            workers = min(PRELOAD_MAX_WORKERS, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(lambda item: self._render_thumbnail(item[0], size), pending)
+
+                # QPixmap, caché y estadísticas en el hilo llamador
+                for (img_path, disk_key), data in zip(pending, results):
+                    self._store_rendered(img_path, size, disk_key, data)
 
         logger.info("Thumbnails preloaded")
@@ -4,18 +4,292 @@ Left Panel - Panel izquierdo con tabs: Historial, Filtros, Ayuda
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QTabWidget, QLabel,
     QScrollArea, QPushButton, QCheckBox, QLineEdit,
-    QHBoxLayout, QFrame, QDateEdit
+    QHBoxLayout, QFrame, QDateEdit, QListView,
+    QStyledItemDelegate, QStyle
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QDate
-from PyQt6.QtGui import QFont
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, pyqtSlot, QDate, QAbstractListModel, QModelIndex, QRectF, QSize,
+    QSignalBlocker, QObject, QRunnable, QThreadPool
+)
+from PyQt6.QtGui import QFont, QFontMetrics, QColor, QPainter, QTextOption
+from bisect import bisect_left
+from collections import deque
+from functools import lru_cache, partial
+import re
 
 import logging
 logger = logging.getLogger(__name__)
 
+# Tipos de item filtrables (orden en el que se reportan en los filtros)
+_ITEM_TYPES = ('CODE', 'URL', 'PATH', 'TEXT')
+
+# Separador de tags: la coma absorbe los espacios de alrededor (split + strip en una pasada)
+_TAG_SPLIT = re.compile(r"\s*,\s*")
+
+# ==================== ESTILOS (QSS compartido) ====================
+
+# Cabecera de cada panel
+_HEADER_QSS = """
+    QLabel {
+        color: #ffffff;
+        font-size: 13px;
+        font-weight: bold;
+        padding: 5px;
+    }
+"""
+
+# Marco de grupo de filtros / sección de ayuda
+_GROUP_FRAME_QSS = """
+    QFrame {
+        background-color: #2a2a2a;
+        border: 1px solid #3a3a3a;
+        border-radius: 6px;
+        padding: 10px;
+    }
+"""
+
+# Título de grupo de filtros
+_GROUP_TITLE_QSS = """
+    QLabel {
+        color: #f093fb;
+        font-size: 11px;
+        font-weight: bold;
+    }
+"""
+
+# Checkboxes de filtros
+_FILTER_CHECKBOX_QSS = """
+    QCheckBox {
+        color: #ffffff;
+        font-size: 11px;
+        spacing: 5px;
+    }
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        border: 2px solid #3a3a3a;
+        border-radius: 3px;
+        background-color: #1e1e1e;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #f093fb;
+        border-color: #f093fb;
+    }
+    QCheckBox::indicator:hover {
+        border-color: #f093fb;
+    }
+"""
+
+# Selectores de fecha (desde/hasta)
+_DATE_EDIT_QSS = """
+    QDateEdit {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        border: 2px solid #3a3a3a;
+        border-radius: 4px;
+        padding: 6px 8px;
+        font-size: 11px;
+    }
+    QDateEdit:hover {
+        border-color: #f093fb;
+    }
+    QDateEdit::drop-down {
+        border: none;
+        padding-right: 8px;
+    }
+    QDateEdit::down-arrow {
+        image: none;
+        border: none;
+    }
+"""
+
+# Checkboxes de campos de fecha (más compactos)
+_DATE_FIELD_CHECKBOX_QSS = """
+    QCheckBox {
+        color: #ffffff;
+        font-size: 10px;
+        spacing: 5px;
+    }
+    QCheckBox::indicator {
+        width: 14px;
+        height: 14px;
+        border: 2px solid #3a3a3a;
+        border-radius: 3px;
+        background-color: #1e1e1e;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #f093fb;
+        border-color: #f093fb;
+    }
+"""
+
+# Contenedor de tags: incluye el estilo de los checkboxes [role="tag"]
+_TAGS_CONTAINER_QSS = """
+    QWidget {
+        background-color: #1e1e1e;
+    }
+    QCheckBox[role="tag"] {
+        color: #ffffff;
+        font-size: 11px;
+        spacing: 5px;
+        padding: 4px 8px;
+        background-color: #2a2a2a;
+        border-radius: 4px;
+    }
+    QCheckBox[role="tag"]:hover {
+        background-color: #3a3a3a;
+    }
+    QCheckBox[role="tag"]::indicator {
+        width: 16px;
+        height: 16px;
+        border: 2px solid #3a3a3a;
+        border-radius: 3px;
+        background-color: #1e1e1e;
+    }
+    QCheckBox[role="tag"]::indicator:checked {
+        background-color: #f093fb;
+        border-color: #f093fb;
+    }
+    QCheckBox[role="tag"]::indicator:hover {
+        border-color: #f093fb;
+    }
+"""
+
+# Botones seleccionar/deseleccionar todos
+_ACTION_BUTTON_QSS = """
+    QPushButton {
+        background-color: #2a2a2a;
+        color: #ffffff;
+        border: 1px solid #3a3a3a;
+        border-radius: 4px;
+        padding: 8px;
+        font-size: 11px;
+    }
+    QPushButton:hover {
+        background-color: #3a3a3a;
+        border-color: #f093fb;
+    }
+    QPushButton:disabled {
+        background-color: #1e1e1e;
+        color: #555555;
+        border-color: #2a2a2a;
+    }
+"""
+
+# Labels de las secciones de ayuda (aplicado a nivel de HelpPanel)
+_HELP_PANEL_QSS = """
+    QLabel#HelpSectionTitle {
+        color: #f093fb;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    QLabel#HelpItemLabel {
+        color: #4ec9b0;
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 11px;
+    }
+    QLabel#HelpItemDesc {
+        color: #888888;
+        font-size: 10px;
+    }
+"""
+
+
+class HistoryModel(QAbstractListModel):
+    """Modelo de historial: las filas se materializan solo al pintarse"""
+
+    MAX_ITEMS = 10
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items = deque(maxlen=self.MAX_ITEMS)  # (query, mode, result_count)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._items):
+            return None
+
+        query, mode, result_count = self._items[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"🔍 {query}"
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"Modo: {mode.upper()}\nResultados: {result_count}"
+        return None
+
+    def entry(self, row):
+        """Get (query, mode, result_count) for a row"""
+        return self._items[row]
+
+    def add_entry(self, query, mode, result_count):
+        """Insert entry at top, dropping the oldest one when full"""
+        if len(self._items) == self.MAX_ITEMS:
+            last = self.MAX_ITEMS - 1
+            self.beginRemoveRows(QModelIndex(), last, last)
+            self._items.pop()
+            self.endRemoveRows()
+
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._items.appendleft((query, mode, result_count))
+        self.endInsertRows()
+
+    def clear(self):
+        """Remove all entries"""
+        self.beginResetModel()
+        self._items.clear()
+        self.endResetModel()
+
+
+class HistoryItemDelegate(QStyledItemDelegate):
+    """Dibuja las filas del historial (fondo, borde rosa en hover) sin QSS por widget"""
+
+    PADDING = 8
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._text_option = QTextOption(
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        )
+        self._text_option.setWrapMode(QTextOption.WrapMode.NoWrap)
+        self._font = QFont()
+        self._font.setPixelSize(11)
+        self._metrics = QFontMetrics(self._font)
+        self._row_height = self._metrics.height() + 2 * self.PADDING + 2
+        self._background = QColor("#2a2a2a")
+        self._background_hover = QColor("#3a3a3a")
+        self._border = QColor("#3a3a3a")
+        self._border_hover = QColor("#f093fb")
+        self._text_color = QColor("#ffffff")
+
+    def paint(self, painter, option, index):
+        """Paint a history row"""
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        rect = QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self._border_hover if hovered else self._border)
+        painter.setBrush(self._background_hover if hovered else self._background)
+        painter.drawRoundedRect(rect, 4, 4)
+
+        painter.setFont(self._font)
+        painter.setPen(self._text_color)
+        text_rect = rect.adjusted(self.PADDING, 0, -self.PADDING, 0)
+        text = self._metrics.elidedText(
+            index.data(Qt.ItemDataRole.DisplayRole) or "",
+            Qt.TextElideMode.ElideRight,
+            int(text_rect.width())
+        )
+        painter.drawText(text_rect, text, self._text_option)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        """All rows share the same height (uniform item sizes)"""
+        return QSize(option.rect.width(), self._row_height)
+
 
 class HistoryPanel(QWidget):
     """Panel de historial de búsquedas recientes"""
@@ -24,7 +298,6 @@ class HistoryPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.history = []  # List of recent searches
         self.init_ui()
 
     def init_ui(self):
@@ -35,37 +308,9 @@ class HistoryPanel(QWidget):
 
         # Header
         header = QLabel("Búsquedas Recientes")
-        header.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 5px;
-            }
-        """)
+        header.setStyleSheet(_HEADER_QSS)
         layout.addWidget(header)
 
-        # Scroll area for history items
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-        """)
-
-        # Container for history items
-        self.history_container = QWidget()
-        self.history_container.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-            }
-        """)
-        self.history_layout = QVBoxLayout(self.history_container)
-        self.history_layout.setContentsMargins(0, 0, 0, 0)
-        self.history_layout.setSpacing(5)
-
         # Empty state
         self.empty_label = QLabel("No hay búsquedas recientes")
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -76,12 +321,32 @@ class HistoryPanel(QWidget):
                 padding: 30px;
             }
         """)
-        self.history_layout.addWidget(self.empty_label)
-
-        self.history_layout.addStretch()
+        layout.addWidget(self.empty_label)
+
+        # Vista virtualizada: solo las filas visibles se pintan
+        self.model = HistoryModel(self)
+        self.history_view = QListView()
+        self.history_view.setModel(self.model)
+        self.history_view.setItemDelegate(HistoryItemDelegate(self.history_view))
+        self.history_view.setUniformItemSizes(True)
+        self.history_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.history_view.setSpacing(2)
+        self.history_view.setMouseTracking(True)
+        self.history_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.history_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.history_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.history_view.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.history_view.setStyleSheet("""
+            QListView {
+                background-color: #1e1e1e;
+                border: none;
+            }
+        """)
+        self.history_view.clicked.connect(self._on_row_activated)
+        self.history_view.setVisible(False)
+        layout.addWidget(self.history_view, 1)
 
-        scroll.setWidget(self.history_container)
-        layout.addWidget(scroll)
+        layout.addStretch()
 
     def add_search(self, query, mode, result_count):
         """Add a search to history"""
@@ -90,41 +355,23 @@ class HistoryPanel(QWidget):
 
         # Wrap all widget access in try-except to handle deleted widgets
         try:
-            # Remove empty label if present
-            self.empty_label.setVisible(False)
-
-            # Create history item button
-            item = QPushButton(f"🔍 {query}")
-            item.setToolTip(f"Modo: {mode.upper()}\nResultados: {result_count}")
-            item.setStyleSheet("""
-                QPushButton {
-                    background-color: #2a2a2a;
-                    color: #ffffff;
-                    border: 1px solid #3a3a3a;
-                    border-radius: 4px;
-                    padding: 8px;
-                    text-align: left;
-                    font-size: 11px;
-                }
-                QPushButton:hover {
-                    background-color: #3a3a3a;
-                    border-color: #f093fb;
-                }
-            """)
-            item.clicked.connect(lambda: self._on_history_clicked(query, mode))
-
-            # Insert at top
-            self.history_layout.insertWidget(0, item)
-
-            # Limit history to 10 items
-            if self.history_layout.count() > 11:  # 10 + stretch
-                widget = self.history_layout.itemAt(10).widget()
-                if widget:
-                    widget.deleteLater()
+            self.model.add_entry(query, mode, result_count)
+
+            if not self.history_view.isVisible():
+                self.empty_label.setVisible(False)
+                self.history_view.setVisible(True)
         except RuntimeError:
             # Widget has been deleted, ignore silently
             logger.debug(f"Cannot add search to history - widgets deleted")
 
+    @pyqtSlot(QModelIndex)
+    def _on_row_activated(self, index):
+        """Handle click on a history row"""
+        if not index.isValid():
+            return
+        query, mode, _ = self.model.entry(index.row())
+        self._on_history_clicked(query, mode)
+
     def _on_history_clicked(self, query, mode):
         """Handle history item click"""
         logger.info(f"History item clicked: {query}")
@@ -132,12 +379,8 @@ class HistoryPanel(QWidget):
 
     def clear_history(self):
         """Clear all history"""
-        # Remove all buttons except empty label
-        while self.history_layout.count() > 1:
-            item = self.history_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
+        self.model.clear()
+        self.history_view.setVisible(False)
         self.empty_label.setVisible(True)
 
 
@@ -148,6 +391,8 @@ class FiltersPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.filter_checkboxes = {}  # filter_key -> QCheckBox
+        self._last_filters_sig = None  # Firma de los últimos filtros emitidos
         self.init_ui()
 
     def init_ui(self):
@@ -158,25 +403,15 @@ class FiltersPanel(QWidget):
 
         # Header
         header = QLabel("Filtros Avanzados")
-        header.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 5px;
-            }
-        """)
+        header.setStyleSheet(_HEADER_QSS)
         layout.addWidget(header)
 
         # Scroll area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-        """)
+        # Sin marco ni fondo propio: mismo resultado que el QSS transparente sin motor de estilos
+        scroll.setFrameShape(QFrame.Shape.NoFrame)
+        scroll.viewport().setAutoFillBackground(False)
 
         container = QWidget()
         container.setStyleSheet("""
@@ -254,14 +489,7 @@ class FiltersPanel(QWidget):
     def _create_filter_group(self, title, options):
         """Create a filter group with checkboxes"""
         group = QFrame()
-        group.setStyleSheet("""
-            QFrame {
-                background-color: #2a2a2a;
-                border: 1px solid #3a3a3a;
-                border-radius: 6px;
-                padding: 10px;
-            }
-        """)
+        group.setStyleSheet(_GROUP_FRAME_QSS)
 
         group_layout = QVBoxLayout(group)
         group_layout.setContentsMargins(10, 10, 10, 10)
@@ -269,56 +497,25 @@ class FiltersPanel(QWidget):
 
         # Title
         title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #f093fb;
-                font-size: 11px;
-                font-weight: bold;
-            }
-        """)
+        title_label.setStyleSheet(_GROUP_TITLE_QSS)
         group_layout.addWidget(title_label)
 
         # Checkboxes
-        self.filter_checkboxes = getattr(self, 'filter_checkboxes', {})
+        filter_checkboxes = self.filter_checkboxes
         for label, value in options:
             checkbox = QCheckBox(label)
-            checkbox.setStyleSheet("""
-                QCheckBox {
-                    color: #ffffff;
-                    font-size: 11px;
-                    spacing: 5px;
-                }
-                QCheckBox::indicator {
-                    width: 16px;
-                    height: 16px;
-                    border: 2px solid #3a3a3a;
-                    border-radius: 3px;
-                    background-color: #1e1e1e;
-                }
-                QCheckBox::indicator:checked {
-                    background-color: #f093fb;
-                    border-color: #f093fb;
-                }
-                QCheckBox::indicator:hover {
-                    border-color: #f093fb;
-                }
-            """)
-            self.filter_checkboxes[value] = checkbox
+            checkbox.setStyleSheet(_FILTER_CHECKBOX_QSS)
+            filter_checkboxes[value] = checkbox
             group_layout.addWidget(checkbox)
 
         return group
 
     def _create_date_filter_group(self):
         """Create date filter group with date range pickers"""
+        today = QDate.currentDate()
+
         group = QFrame()
-        group.setStyleSheet("""
-            QFrame {
-                background-color: #2a2a2a;
-                border: 1px solid #3a3a3a;
-                border-radius: 6px;
-                padding: 10px;
-            }
-        """)
+        group.setStyleSheet(_GROUP_FRAME_QSS)
 
         group_layout = QVBoxLayout(group)
         group_layout.setContentsMargins(10, 10, 10, 10)
@@ -326,38 +523,12 @@ class FiltersPanel(QWidget):
 
         # Title
         title_label = QLabel("📅 Filtro por Fechas")
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #f093fb;
-                font-size: 11px;
-                font-weight: bold;
-            }
-        """)
+        title_label.setStyleSheet(_GROUP_TITLE_QSS)
         group_layout.addWidget(title_label)
 
         # Enable date filter checkbox
         self.date_filter_enabled = QCheckBox("Habilitar filtro de fechas")
-        self.date_filter_enabled.setStyleSheet("""
-            QCheckBox {
-                color: #ffffff;
-                font-size: 11px;
-                spacing: 5px;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border: 2px solid #3a3a3a;
-                border-radius: 3px;
-                background-color: #1e1e1e;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #f093fb;
-                border-color: #f093fb;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #f093fb;
-            }
-        """)
+        self.date_filter_enabled.setStyleSheet(_FILTER_CHECKBOX_QSS)
         self.date_filter_enabled.stateChanged.connect(self._on_date_filter_toggled)
         group_layout.addWidget(self.date_filter_enabled)
 
@@ -376,29 +547,9 @@ class FiltersPanel(QWidget):
 
         self.date_from = QDateEdit()
         self.date_from.setCalendarPopup(True)
-        self.date_from.setDate(QDate.currentDate().addMonths(-1))  # Default: 1 mes atrás
+        self.date_from.setDate(today.addMonths(-1))  # Default: 1 mes atrás
         self.date_from.setDisplayFormat("dd/MM/yyyy")
-        self.date_from.setStyleSheet("""
-            QDateEdit {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                border: 2px solid #3a3a3a;
-                border-radius: 4px;
-                padding: 6px 8px;
-                font-size: 11px;
-            }
-            QDateEdit:hover {
-                border-color: #f093fb;
-            }
-            QDateEdit::drop-down {
-                border: none;
-                padding-right: 8px;
-            }
-            QDateEdit::down-arrow {
-                image: none;
-                border: none;
-            }
-        """)
+        self.date_from.setStyleSheet(_DATE_EDIT_QSS)
         desde_layout.addWidget(self.date_from)
         date_range_layout.addLayout(desde_layout)
 
@@ -411,29 +562,9 @@ class FiltersPanel(QWidget):
 
         self.date_to = QDateEdit()
         self.date_to.setCalendarPopup(True)
-        self.date_to.setDate(QDate.currentDate())  # Default: hoy
+        self.date_to.setDate(today)  # Default: hoy
         self.date_to.setDisplayFormat("dd/MM/yyyy")
-        self.date_to.setStyleSheet("""
-            QDateEdit {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                border: 2px solid #3a3a3a;
-                border-radius: 4px;
-                padding: 6px 8px;
-                font-size: 11px;
-            }
-            QDateEdit:hover {
-                border-color: #f093fb;
-            }
-            QDateEdit::drop-down {
-                border: none;
-                padding-right: 8px;
-            }
-            QDateEdit::down-arrow {
-                image: none;
-                border: none;
-            }
-        """)
+        self.date_to.setStyleSheet(_DATE_EDIT_QSS)
         hasta_layout.addWidget(self.date_to)
         date_range_layout.addLayout(hasta_layout)
 
@@ -446,45 +577,11 @@ class FiltersPanel(QWidget):
 
         self.date_field_created = QCheckBox("📝 Fecha de creación")
         self.date_field_created.setChecked(True)
-        self.date_field_created.setStyleSheet("""
-            QCheckBox {
-                color: #ffffff;
-                font-size: 10px;
-                spacing: 5px;
-            }
-            QCheckBox::indicator {
-                width: 14px;
-                height: 14px;
-                border: 2px solid #3a3a3a;
-                border-radius: 3px;
-                background-color: #1e1e1e;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #f093fb;
-                border-color: #f093fb;
-            }
-        """)
+        self.date_field_created.setStyleSheet(_DATE_FIELD_CHECKBOX_QSS)
         field_layout.addWidget(self.date_field_created)
 
         self.date_field_last_used = QCheckBox("⏰ Última vez usado")
-        self.date_field_last_used.setStyleSheet("""
-            QCheckBox {
-                color: #ffffff;
-                font-size: 10px;
-                spacing: 5px;
-            }
-            QCheckBox::indicator {
-                width: 14px;
-                height: 14px;
-                border: 2px solid #3a3a3a;
-                border-radius: 3px;
-                background-color: #1e1e1e;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #f093fb;
-                border-color: #f093fb;
-            }
-        """)
+        self.date_field_last_used.setStyleSheet(_DATE_FIELD_CHECKBOX_QSS)
         field_layout.addWidget(self.date_field_last_used)
 
         date_range_layout.addLayout(field_layout)
@@ -502,56 +599,45 @@ class FiltersPanel(QWidget):
 
     def _on_apply_filters(self):
         """Apply selected filters"""
-        filters = {}
-
-        # Collect item types
-        item_types = []
-        for type_key in ['CODE', 'URL', 'PATH', 'TEXT']:
-            if type_key in self.filter_checkboxes and self.filter_checkboxes[type_key].isChecked():
-                item_types.append(type_key)
-
-        if item_types:
-            filters['item_types'] = item_types
-
-        # Collect state filters
-        if 'favorite' in self.filter_checkboxes and self.filter_checkboxes['favorite'].isChecked():
-            filters['is_favorite'] = True
-
-        if 'sensitive' in self.filter_checkboxes and self.filter_checkboxes['sensitive'].isChecked():
-            filters['is_sensitive'] = True
-
-        # Collect date filters
-        if self.date_filter_enabled.isChecked():
-            date_filters = {}
-            date_filters['date_from'] = self.date_from.date().toString('yyyy-MM-dd')
-            date_filters['date_to'] = self.date_to.date().toString('yyyy-MM-dd')
+        filters = self.get_active_filters()
 
-            # Collect which fields to filter
-            fields = []
-            if self.date_field_created.isChecked():
-                fields.append('created_at')
-            if self.date_field_last_used.isChecked():
-                fields.append('last_used')
-
-            if fields:
-                date_filters['fields'] = fields
-                filters['date_range'] = date_filters
+        # Re-aplicar los mismos filtros no debe relanzar la búsqueda
+        signature = _filters_signature(filters)
+        if signature == self._last_filters_sig:
+            logger.debug("Filters unchanged, skipping apply")
+            return
+        self._last_filters_sig = signature
 
         logger.info(f"Filters applied: {filters}")
         self.filters_changed.emit(filters)
 
     def _on_clear_filters(self):
         """Clear all filters"""
-        for checkbox in self.filter_checkboxes.values():
-            checkbox.setChecked(False)
-
-        # Clear date filters
-        self.date_filter_enabled.setChecked(False)
-        self.date_from.setDate(QDate.currentDate().addMonths(-1))
-        self.date_to.setDate(QDate.currentDate())
-        self.date_field_created.setChecked(True)
-        self.date_field_last_used.setChecked(False)
+        # Resetear sin disparar señales intermedias; se emite una sola vez al final
+        widgets = list(self.filter_checkboxes.values()) + [
+            self.date_filter_enabled, self.date_from, self.date_to,
+            self.date_field_created, self.date_field_last_used
+        ]
+        blockers = [QSignalBlocker(widget) for widget in widgets]
+        try:
+            for checkbox in self.filter_checkboxes.values():
+                checkbox.setChecked(False)
+
+            # Clear date filters
+            self.date_filter_enabled.setChecked(False)
+            today = QDate.currentDate()
+            self.date_from.setDate(today.addMonths(-1))
+            self.date_to.setDate(today)
+            self.date_field_created.setChecked(True)
+            self.date_field_last_used.setChecked(False)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+
+        # stateChanged estaba bloqueado: sincronizar el rango manualmente
+        self.date_range_container.setEnabled(False)
 
+        self._last_filters_sig = _filters_signature({})
         self.filters_changed.emit({})
         logger.info("Filters cleared")
 
@@ -559,14 +645,17 @@ class FiltersPanel(QWidget):
         """Get currently active filters"""
         filters = {}
 
-        item_types = []
-        for type_key in ['CODE', 'URL', 'PATH', 'TEXT']:
-            if type_key in self.filter_checkboxes and self.filter_checkboxes[type_key].isChecked():
-                item_types.append(type_key)
+        # Collect item types
+        filter_checkboxes = self.filter_checkboxes
+        item_types = [
+            type_key for type_key in _ITEM_TYPES
+            if (checkbox := filter_checkboxes.get(type_key)) is not None and checkbox.isChecked()
+        ]
 
         if item_types:
             filters['item_types'] = item_types
 
+        # Collect state filters
         if 'favorite' in self.filter_checkboxes and self.filter_checkboxes['favorite'].isChecked():
             filters['is_favorite'] = True
 
@@ -576,8 +665,8 @@ class FiltersPanel(QWidget):
         # Collect date filters
         if self.date_filter_enabled.isChecked():
             date_filters = {}
-            date_filters['date_from'] = self.date_from.date().toString('yyyy-MM-dd')
-            date_filters['date_to'] = self.date_to.date().toString('yyyy-MM-dd')
+            date_filters['date_from'] = _format_date(self.date_from.date().toJulianDay())
+            date_filters['date_to'] = _format_date(self.date_to.date().toJulianDay())
 
             # Collect which fields to filter
             fields = []
@@ -593,14 +682,78 @@ class FiltersPanel(QWidget):
         return filters
 
 
+def _filters_signature(filters):
+    """Build a hashable signature of a filters dict (see FiltersPanel.get_active_filters)"""
+    date_range = filters.get('date_range') or {}
+    return (
+        tuple(filters.get('item_types', ())),
+        filters.get('is_favorite', False),
+        filters.get('is_sensitive', False),
+        date_range.get('date_from'),
+        date_range.get('date_to'),
+        tuple(date_range.get('fields', ())),
+    )
+
+
+@lru_cache(maxsize=64)
+def _format_date(julian_day):
+    """Format a QDate (by Julian day) as 'yyyy-MM-dd', cached per day"""
+    # ISODate produce exactamente yyyy-MM-dd sin parsear un patrón de formato
+    return QDate.fromJulianDay(julian_day).toString(Qt.DateFormat.ISODate)
+
+
+def _extract_tags(results):
+    """Extract the set of unique tags from result dicts ('tags' is comma separated)"""
+    new_tags = set()
+    for result in results:
+        tags_str = result.get('tags')
+        if tags_str:
+            new_tags.update(tag for tag in _TAG_SPLIT.split(tags_str.strip()) if tag)
+    return new_tags
+
+
+class _TagExtractSignals(QObject):
+    """Señales del worker de tags (se entregan en el hilo de la GUI)"""
+
+    # generation, set de tags
+    done = pyqtSignal(int, object)
+
+
+class _TagExtractTask(QRunnable):
+    """Extrae los tags de un set grande de resultados en QThreadPool"""
+
+    def __init__(self, signals: _TagExtractSignals, generation: int, results: list):
+        super().__init__()
+        self._signals = signals
+        self._generation = generation
+        self._results = results
+
+    def run(self):
+        new_tags = _extract_tags(self._results)
+        # Soltar los resultados ya: el wrapper Python del runnable puede
+        # sobrevivir a run() y retendría la lista completa
+        self._results = None
+        self._signals.done.emit(self._generation, new_tags)
+
+
 class TagsFilterPanel(QWidget):
     """Panel de filtro dinámico por tags basado en resultados de búsqueda"""
 
     tags_filter_changed = pyqtSignal(list)  # List of selected tags
 
+    # A partir de cuántos resultados la extracción de tags va a un worker
+    ASYNC_TAGS_THRESHOLD = 200
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.tag_checkboxes = {}  # tag_name -> QCheckBox
+        self._tag_order = []  # Tags en el orden del layout (alfabético)
+        self._selected = set()  # Tags marcados, mantenido por cada toggle
+        self._tags_generation = 0  # Descarta extracciones en segundo plano obsoletas
+        self._tag_signals = _TagExtractSignals(self)
+        self._tag_signals.done.connect(
+            self._on_tags_extracted, Qt.ConnectionType.QueuedConnection
+        )
         self.available_tags = set()  # Tags from current results
         self.init_ui()
 
@@ -613,14 +766,7 @@ class TagsFilterPanel(QWidget):
         # Header
         header_layout = QHBoxLayout()
         header = QLabel("🏷️ Filtro por Tags")
-        header.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 5px;
-            }
-        """)
+        header.setStyleSheet(_HEADER_QSS)
         header_layout.addWidget(header)
 
         # Tag count badge
@@ -639,11 +785,10 @@ class TagsFilterPanel(QWidget):
         # Scroll area for tag checkboxes
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
+        scroll.setFrameShape(QFrame.Shape.NoFrame)
+        scroll.viewport().setAutoFillBackground(False)
+        # QSS solo en la barra de scroll, no en todo el scroll area
+        scroll.verticalScrollBar().setStyleSheet("""
             QScrollBar:vertical {
                 background-color: #1e1e1e;
                 width: 10px;
@@ -661,11 +806,8 @@ class TagsFilterPanel(QWidget):
 
         # Container for tag checkboxes
         self.tags_container = QWidget()
-        self.tags_container.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-            }
-        """)
+        # QSS de los checkboxes de tags definido una sola vez en el contenedor
+        self.tags_container.setStyleSheet(_TAGS_CONTAINER_QSS)
         self.tags_layout = QVBoxLayout(self.tags_container)
         self.tags_layout.setContentsMargins(0, 0, 0, 0)
         self.tags_layout.setSpacing(6)
@@ -692,50 +834,14 @@ class TagsFilterPanel(QWidget):
 
         # Select all button
         self.select_all_btn = QPushButton("✓ Seleccionar Todos")
-        self.select_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                border: 1px solid #3a3a3a;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #3a3a3a;
-                border-color: #f093fb;
-            }
-            QPushButton:disabled {
-                background-color: #1e1e1e;
-                color: #555555;
-                border-color: #2a2a2a;
-            }
-        """)
+        self.select_all_btn.setStyleSheet(_ACTION_BUTTON_QSS)
         self.select_all_btn.clicked.connect(self._on_select_all)
         self.select_all_btn.setEnabled(False)
         buttons_layout.addWidget(self.select_all_btn)
 
         # Deselect all button
         self.deselect_all_btn = QPushButton("✗ Deseleccionar Todos")
-        self.deselect_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                border: 1px solid #3a3a3a;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #3a3a3a;
-                border-color: #f093fb;
-            }
-            QPushButton:disabled {
-                background-color: #1e1e1e;
-                color: #555555;
-                border-color: #2a2a2a;
-            }
-        """)
+        self.deselect_all_btn.setStyleSheet(_ACTION_BUTTON_QSS)
         self.deselect_all_btn.clicked.connect(self._on_deselect_all)
         self.deselect_all_btn.setEnabled(False)
         buttons_layout.addWidget(self.deselect_all_btn)
@@ -751,109 +857,162 @@ class TagsFilterPanel(QWidget):
         """
         logger.info(f"Updating tags filter from {len(results)} results")
 
-        # Extract unique tags from results
-        new_tags = set()
-        for result in results:
-            tags_str = result.get('tags', '')
-            if tags_str:
-                # Split tags by comma and clean whitespace
-                tags = [tag.strip() for tag in tags_str.split(',') if tag.strip()]
-                new_tags.update(tags)
+        # Cada llamada invalida las extracciones en curso (resultados viejos)
+        self._tags_generation += 1
+
+        if len(results) > self.ASYNC_TAGS_THRESHOLD:
+            # Extraer en QThreadPool; solo el diff-update corre en la GUI.
+            # get_selected_tags() sigue devolviendo la selección anterior
+            # hasta _on_tags_extracted, que emite tags_filter_changed
+            QThreadPool.globalInstance().start(
+                _TagExtractTask(self._tag_signals, self._tags_generation, list(results))
+            )
+            return
+
+        self._apply_tags(_extract_tags(results))
+
+    def _on_tags_extracted(self, generation, new_tags):
+        """Apply tags extracted by a worker, unless a newer update superseded it"""
+        if generation != self._tags_generation:
+            logger.debug("Discarding stale tag extraction")
+            return
+
+        # Quien llamó update_tags_from_results ya filtró con la selección
+        # anterior: si cambió, avisar para que vuelva a filtrar
+        previous = set(self._selected)
+        self._apply_tags(new_tags)
+        if self._selected != previous:
+            self.tags_filter_changed.emit(self.get_selected_tags())
+
+    def _apply_tags(self, new_tags):
+        """
+        Diff-update tag checkboxes against the current tag set
 
+        Args:
+            new_tags: Set of unique tags from the current results
+        """
         # Only update if tags changed
         if new_tags == self.available_tags:
             logger.debug("Tags unchanged, skipping update")
             return
 
+        # Actualizar solo la diferencia: los checkboxes que siguen existiendo
+        # conservan su widget (y su estado), los nuevos entran marcados
+        added = new_tags - self.available_tags
+        removed = self.available_tags - new_tags
         self.available_tags = new_tags
-        logger.info(f"Found {len(new_tags)} unique tags")
+        logger.info(f"Found {len(new_tags)} unique tags (+{len(added)} / -{len(removed)})")
 
-        # Clear existing checkboxes
-        self._clear_tag_checkboxes()
-
-        if not new_tags:
-            # Show empty state
-            self.empty_label.setVisible(True)
-            self.select_all_btn.setEnabled(False)
-            self.deselect_all_btn.setEnabled(False)
-            self.tag_count_label.setText("(0)")
-            return
-
-        # Hide empty state
-        self.empty_label.setVisible(False)
-        self.select_all_btn.setEnabled(True)
-        self.deselect_all_btn.setEnabled(True)
-
-        # Create checkbox for each unique tag (sorted alphabetically)
-        for tag in sorted(new_tags):
-            checkbox = QCheckBox(f"🏷️  {tag}")
-            checkbox.setChecked(True)  # All tags selected by default
-            checkbox.setStyleSheet("""
-                QCheckBox {
-                    color: #ffffff;
-                    font-size: 11px;
-                    spacing: 5px;
-                    padding: 4px 8px;
-                    background-color: #2a2a2a;
-                    border-radius: 4px;
-                }
-                QCheckBox:hover {
-                    background-color: #3a3a3a;
-                }
-                QCheckBox::indicator {
-                    width: 16px;
-                    height: 16px;
-                    border: 2px solid #3a3a3a;
-                    border-radius: 3px;
-                    background-color: #1e1e1e;
-                }
-                QCheckBox::indicator:checked {
-                    background-color: #f093fb;
-                    border-color: #f093fb;
-                }
-                QCheckBox::indicator:hover {
-                    border-color: #f093fb;
-                }
-            """)
-            checkbox.stateChanged.connect(self._on_tag_checkbox_changed)
-
-            self.tag_checkboxes[tag] = checkbox
-            # Insert before stretch
-            self.tags_layout.insertWidget(self.tags_layout.count() - 1, checkbox)
+        # Congelar repintado mientras se muta el layout: un solo relayout+paint
+        self.tags_container.setUpdatesEnabled(False)
+        try:
+            for tag in removed:
+                self._remove_tag_checkbox(self.tag_checkboxes.pop(tag))
+                self._tag_order.remove(tag)
+                self._selected.discard(tag)
+
+            added = sorted(added)
+            self._selected.update(added)
+
+            if not self._tag_order:
+                # Carga completa: sacar el stretch, añadir en orden con addWidget
+                # (sin desplazar elementos) y volver a ponerlo al final
+                stretch = self.tags_layout.takeAt(self.tags_layout.count() - 1)
+                for tag in added:
+                    checkbox = self._create_tag_checkbox(tag)
+                    self.tag_checkboxes[tag] = checkbox
+                    self.tags_layout.addWidget(checkbox)
+                self.tags_layout.addItem(stretch)
+                self._tag_order = added
+            else:
+                # Posición ordenada, justo después del empty label
+                base = self.tags_layout.indexOf(self.empty_label) + 1
+                for tag in added:
+                    position = bisect_left(self._tag_order, tag)
+                    self._tag_order.insert(position, tag)
+                    checkbox = self._create_tag_checkbox(tag)
+                    self.tag_checkboxes[tag] = checkbox
+                    self.tags_layout.insertWidget(base + position, checkbox)
+
+            has_tags = bool(new_tags)
+            self.empty_label.setVisible(not has_tags)
+            self.tags_layout.activate()
+        finally:
+            self.tags_container.setUpdatesEnabled(True)
+
+        self.select_all_btn.setEnabled(has_tags)
+        self.deselect_all_btn.setEnabled(has_tags)
 
         # Update count
         self.tag_count_label.setText(f"({len(new_tags)})")
 
+    def _create_tag_checkbox(self, tag):
+        """Create checkbox for a tag (selected by default)"""
+        checkbox = QCheckBox(f"🏷️  {tag}")
+        checkbox.setChecked(True)  # All tags selected by default
+        # Estilo heredado del QSS de tags_container (se aplica al hacer polish)
+        checkbox.setProperty("role", "tag")
+        checkbox.stateChanged.connect(partial(self._on_tag_toggled, tag))
+        return checkbox
+
+    def _remove_tag_checkbox(self, checkbox):
+        """Detach a tag checkbox from layout and parent, then delete it"""
+        # Sacar del layout y del padre antes de deleteLater para no dejar
+        # punteros colgando en el layout hasta que se procese el evento
+        self.tags_layout.removeWidget(checkbox)
+        checkbox.hide()
+        checkbox.setParent(None)
+        checkbox.deleteLater()
+
     def _clear_tag_checkboxes(self):
         """Remove all tag checkboxes"""
         for checkbox in self.tag_checkboxes.values():
-            checkbox.deleteLater()
+            self._remove_tag_checkbox(checkbox)
         self.tag_checkboxes.clear()
+        self._tag_order.clear()
+        self._selected.clear()
 
-    def _on_tag_checkbox_changed(self):
+    def _on_tag_toggled(self, tag, state):
         """Handle tag checkbox state change"""
+        if state:
+            self._selected.add(tag)
+        else:
+            self._selected.discard(tag)
+
         selected_tags = self.get_selected_tags()
         logger.debug(f"Tags filter changed: {len(selected_tags)} tags selected")
         self.tags_filter_changed.emit(selected_tags)
 
     def _on_select_all(self):
         """Select all tag checkboxes"""
-        for checkbox in self.tag_checkboxes.values():
-            checkbox.setChecked(True)
+        self._set_all_tags_checked(True)
         logger.info("All tags selected")
 
     def _on_deselect_all(self):
         """Deselect all tag checkboxes"""
-        for checkbox in self.tag_checkboxes.values():
-            checkbox.setChecked(False)
+        self._set_all_tags_checked(False)
         logger.info("All tags deselected")
 
+    def _set_all_tags_checked(self, checked):
+        """Check/uncheck every tag emitting tags_filter_changed only once"""
+        blockers = [QSignalBlocker(checkbox) for checkbox in self.tag_checkboxes.values()]
+        try:
+            for checkbox in self.tag_checkboxes.values():
+                checkbox.setChecked(checked)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+
+        self._selected = set(self.tag_checkboxes) if checked else set()
+        self.tags_filter_changed.emit(self.get_selected_tags())
+
     def get_selected_tags(self):
         """Get list of currently selected tags"""
-        return [tag for tag, checkbox in self.tag_checkboxes.items() if checkbox.isChecked()]
+        return sorted(self._selected)
 
     def clear(self):
         """Clear all tags"""
+        self._tags_generation += 1  # Ignorar extracciones aún en curso
         self._clear_tag_checkboxes()
         self.available_tags.clear()
         self.empty_label.setVisible(True)
@@ -871,30 +1030,26 @@ class HelpPanel(QWidget):
 
     def init_ui(self):
         """Initialize UI"""
+        # Estilos de las secciones por objectName: una sola hoja para todo
+        # el panel en lugar de parsear QSS en cada label de ayuda
+        self.setStyleSheet(_HELP_PANEL_QSS)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(10)
 
         # Header
         header = QLabel("💡 Ayuda de Búsqueda")
-        header.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 5px;
-            }
-        """)
+        header.setStyleSheet(_HEADER_QSS)
         layout.addWidget(header)
 
         # Scroll area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
+        scroll.setFrameShape(QFrame.Shape.NoFrame)
+        scroll.viewport().setAutoFillBackground(False)
+        # QSS solo en la barra de scroll, no en todo el scroll area
+        scroll.verticalScrollBar().setStyleSheet("""
             QScrollBar:vertical {
                 background-color: #1e1e1e;
                 width: 10px;
@@ -958,14 +1113,7 @@ class HelpPanel(QWidget):
     def _create_section(self, title, items):
         """Create a help section"""
         section = QFrame()
-        section.setStyleSheet("""
-            QFrame {
-                background-color: #2a2a2a;
-                border: 1px solid #3a3a3a;
-                border-radius: 6px;
-                padding: 10px;
-            }
-        """)
+        section.setStyleSheet(_GROUP_FRAME_QSS)
 
         section_layout = QVBoxLayout(section)
         section_layout.setContentsMargins(10, 10, 10, 10)
@@ -973,13 +1121,7 @@ class HelpPanel(QWidget):
 
         # Title
         title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #f093fb;
-                font-size: 12px;
-                font-weight: bold;
-            }
-        """)
+        title_label.setObjectName("HelpSectionTitle")
         section_layout.addWidget(title_label)
 
         # Items
@@ -989,23 +1131,12 @@ class HelpPanel(QWidget):
 
             # Label (example)
             label_widget = QLabel(f"  {label}")
-            label_widget.setStyleSheet("""
-                QLabel {
-                    color: #4ec9b0;
-                    font-family: 'Consolas', 'Courier New', monospace;
-                    font-size: 11px;
-                }
-            """)
+            label_widget.setObjectName("HelpItemLabel")
             item_layout.addWidget(label_widget)
 
             # Description
             desc_widget = QLabel(f"    → {description}")
-            desc_widget.setStyleSheet("""
-                QLabel {
-                    color: #888888;
-                    font-size: 10px;
-                }
-            """)
+            desc_widget.setObjectName("HelpItemDesc")
             desc_widget.setWordWrap(True)
             item_layout.addWidget(desc_widget)
 
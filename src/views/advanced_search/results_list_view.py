@@ -1,24 +1,148 @@
 """
 Results List View - Display search results in a scrollable list
 """
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QLabel
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QLabel, QListView, QStyledItemDelegate, QAbstractItemView
+)
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractListModel, QModelIndex, QSize, QTimer
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from views.widgets.item_widget import ItemButton
 from models.item import Item
+from styles.panel_styles import PanelStyles
 
 import logging
 logger = logging.getLogger(__name__)
 
 
+def _result_to_item(result):
+    """Convert a search result dict to the Item shown by ItemButton"""
+    tags = result.get('tags')
+    item = Item(
+        item_id=str(result.get('id', '')),
+        label=result.get('label', ''),
+        content=result.get('content', ''),
+        item_type=result.get('type', 'TEXT').lower(),  # Convert to lowercase for ItemType enum
+        description=result.get('description'),
+        tags=tags.split(',') if tags else [],
+        is_favorite=bool(result.get('is_favorite', 0)),
+        is_sensitive=bool(result.get('is_sensitive', 0)),
+        is_active=True
+    )
+
+    # Add category name as custom attribute for display
+    item.category_name = result.get('category_name', 'Sin categoría')
+    item.category_icon = result.get('category_icon', '📁')
+
+    # Add date and usage fields from search results
+    item.use_count = result.get('use_count', 0)
+    item.last_used = result.get('last_used')
+    item.created_at = result.get('created_at')
+
+    return item
+
+
+class ResultsModel(QAbstractListModel):
+    """
+    Modelo de resultados: solo guarda los dicts, sin widgets por fila
+
+    Las filas se exponen por lotes (canFetchMore/fetchMore): el view pide
+    el siguiente lote al llegar al final del scroll, así un set de miles
+    de resultados no se maqueta entero de una vez
+    """
+
+    FETCH_BATCH = 100
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._results = []
+        self._items = {}  # Fila -> Item ya construido (solo filas que se mostraron)
+        self._loaded = 0  # Filas expuestas al view
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded < len(self._results)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH, len(self._results) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+
+        result = self._results[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return result.get('label', '')
+        if role == Qt.ItemDataRole.UserRole:
+            return result
+        return None
+
+    def result(self, row):
+        """Get raw result dict for a row"""
+        return self._results[row]
+
+    def item(self, row):
+        """Get the Item for a row, built on first use and kept until the next reset"""
+        item = self._items.get(row)
+        if item is None:
+            item = self._items[row] = _result_to_item(self._results[row])
+        return item
+
+    def set_results(self, results):
+        """Replace all results (single model reset)"""
+        self.beginResetModel()
+        self._results = results
+        self._items = {}
+        self._loaded = min(len(results), self.FETCH_BATCH)
+        self.endResetModel()
+
+
+class _ResultRowDelegate(QStyledItemDelegate):
+    """Filas de alto fijo; el contenido lo dibuja el ItemButton de la fila"""
+
+    def paint(self, painter, option, index):
+        # El ItemButton posicionado sobre la fila la cubre completa
+        pass
+
+    def sizeHint(self, option, index):
+        # Ancho mínimo del ItemButton: QListView estira la fila al ancho del
+        # viewport y, si este es más estrecho, muestra scroll horizontal
+        return QSize(ResultsListView.ROW_MIN_WIDTH, PanelStyles.ITEM_HEIGHT)
+
+
+class _ResultsListWidget(QListView):
+    """QListView que avisa cada vez que recalcula geometrías (layout/resize)"""
+
+    geometries_updated = pyqtSignal()
+
+    def updateGeometries(self):
+        super().updateGeometries()
+        self.geometries_updated.emit()
+
+
 class ResultsListView(QWidget):
     """
     List view for search results
 
-    Displays results as a vertical list of ItemButton widgets
+    Displays results in a virtualized QListView: the model holds the result
+    dicts and a small pool of ItemButton widgets is placed over the rows near
+    the viewport. Widgets that scroll away (or belong to a previous result
+    set) are rebound to new rows instead of being destroyed and recreated.
     """
 
     # Signal emitted when an item is clicked
@@ -27,10 +151,26 @@ class ResultsListView(QWidget):
     # Signal emitted when URL should be opened in embedded browser
     url_open_requested = pyqtSignal(str)
 
+    # Margen alrededor de cada fila (QListView.setSpacing, se aplica a cada lado)
+    ROW_SPACING = 4
+    # Filas extra con widget por encima/debajo del viewport
+    ROW_BUFFER = 5
+    # Ancho mínimo de fila: el de ItemButton (setMinimumWidth en init_ui)
+    ROW_MIN_WIDTH = 300
+    # Ráfagas de update_results (p.ej. varios tags marcados seguidos) se
+    # agrupan: solo el último set de resultados llega a pintarse
+    RENDER_DEBOUNCE_MS = 120
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.results = []
-        self.item_widgets = []
+        self.item_widgets = {}  # row -> ItemButton (solo filas cercanas al viewport)
+        self._free_widgets = []  # ItemButtons ocultos listos para rebind()
+        self._pending_results = None
+
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.timeout.connect(self._do_update)
 
         self.init_ui()
 
@@ -40,15 +180,37 @@ class ResultsListView(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
-        # Scroll area for results
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
+        # Empty state label
+        self.empty_label = QLabel("No hay resultados")
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.setStyleSheet("""
+            QLabel {
+                background-color: #1e1e1e;
+                color: #888888;
+                font-size: 14px;
+                padding: 50px;
+            }
+        """)
+        layout.addWidget(self.empty_label)
+
+        # Virtualized list: model + fixed-height rows
+        self.model = ResultsModel(self)
+        self.view = _ResultsListWidget()
+        self.view.setModel(self.model)
+        self.view.setItemDelegate(_ResultRowDelegate(self.view))
+        self.view.setUniformItemSizes(True)
+        self.view.setSpacing(self.ROW_SPACING)
+        self.view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.view.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.view.setStyleSheet("""
+            QListView {
                 background-color: #1e1e1e;
                 border: none;
+                padding: 6px;
             }
             QScrollBar:vertical {
                 background-color: #1e1e1e;
@@ -83,107 +245,125 @@ class ResultsListView(QWidget):
                 width: 0px;
             }
         """)
-
-        # Container widget for scroll area
-        self.scroll_widget = QWidget()
-        self.scroll_widget.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-            }
-        """)
-        self.scroll_layout = QVBoxLayout(self.scroll_widget)
-        self.scroll_layout.setContentsMargins(10, 10, 10, 10)
-        self.scroll_layout.setSpacing(8)
-
-        # Empty state label
-        self.empty_label = QLabel("No hay resultados")
-        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.empty_label.setStyleSheet("""
-            QLabel {
-                color: #888888;
-                font-size: 14px;
-                padding: 50px;
-            }
-        """)
-        self.scroll_layout.addWidget(self.empty_label)
-
-        # Add stretch to push items to top
-        self.scroll_layout.addStretch()
-
-        self.scroll_area.setWidget(self.scroll_widget)
-        layout.addWidget(self.scroll_area)
+        self.view.verticalScrollBar().valueChanged.connect(self._sync_row_widgets)
+        self.view.horizontalScrollBar().valueChanged.connect(self._sync_row_widgets)
+        self.view.geometries_updated.connect(self._sync_row_widgets)
+        self.view.setVisible(False)
+        layout.addWidget(self.view)
 
     def update_results(self, results):
         """
-        Update the list with new results
+        Update the list with new results (debounced, see RENDER_DEBOUNCE_MS)
 
         Args:
             results: List of result dictionaries from AdvancedSearchEngine
         """
-        logger.info(f"Updating list view with {len(results)} results")
+        self._pending_results = results
+        self._render_timer.start(self.RENDER_DEBOUNCE_MS)
+
+    def _do_update(self):
+        """Render the last results passed to update_results"""
+        results = self._pending_results
+        self._pending_results = None
+        if results is None:
+            return
 
-        # Clear existing widgets
-        self.clear_results()
+        logger.info(f"Updating list view with {len(results)} results")
 
+        # Los widgets actuales vuelven al pool; se reasignan tras el reset
+        self._release_all_widgets()
         self.results = results
+        self.model.set_results(results)
 
-        if not results:
-            self.empty_label.setVisible(True)
-            return
+        has_results = bool(results)
+        self.empty_label.setVisible(not has_results)
+        self.view.setVisible(has_results)
 
-        self.empty_label.setVisible(False)
-
-        # Create ItemButton for each result
-        for result in results:
-            try:
-                # Convert result dict to Item object
-                item = Item(
-                    item_id=str(result.get('id', '')),
-                    label=result.get('label', ''),
-                    content=result.get('content', ''),
-                    item_type=result.get('type', 'TEXT').lower(),  # Convert to lowercase for ItemType enum
-                    description=result.get('description'),
-                    tags=result.get('tags', '').split(',') if result.get('tags') else [],
-                    is_favorite=bool(result.get('is_favorite', 0)),
-                    is_sensitive=bool(result.get('is_sensitive', 0)),
-                    is_active=True
-                )
-
-                # Add category name as custom attribute for display
-                item.category_name = result.get('category_name', 'Sin categoría')
-                item.category_icon = result.get('category_icon', '📁')
-
-                # Add date and usage fields from search results
-                item.use_count = result.get('use_count', 0)
-                item.last_used = result.get('last_used')
-                item.created_at = result.get('created_at')
-
-                # Create item widget with category badge
-                item_widget = ItemButton(item, show_category=True)
-                item_widget.item_clicked.connect(self._on_item_clicked)
-                item_widget.url_open_requested.connect(self._on_url_open_requested)
-
-                # Insert before stretch
-                self.scroll_layout.insertWidget(
-                    self.scroll_layout.count() - 1,
-                    item_widget
-                )
-
-                self.item_widgets.append(item_widget)
-
-            except Exception as e:
-                logger.error(f"Error creating item widget: {e}", exc_info=True)
-
-        logger.debug(f"Created {len(self.item_widgets)} item widgets")
+        if has_results:
+            # El relayout del view (updateGeometries) asigna widgets a las filas visibles
+            self.view.scrollToTop()
 
-    def clear_results(self):
-        """Clear all result widgets"""
-        # Remove all item widgets
-        for widget in self.item_widgets:
-            widget.deleteLater()
+    def _sync_row_widgets(self, *args):
+        """Ensure ItemButtons exist only for rows around the viewport"""
+        count = self.model.rowCount()
+        if not count:
+            return
 
+        # Filas de alto fijo: la ventana visible sale del scroll en píxeles
+        pitch = PanelStyles.ITEM_HEIGHT + 2 * self.ROW_SPACING
+        offset = self.view.verticalScrollBar().value()
+        height = self.view.viewport().height()
+        start = max(0, offset // pitch - self.ROW_BUFFER)
+        end = min(count - 1, (offset + height) // pitch + self.ROW_BUFFER)
+
+        stale = [row for row in self.item_widgets if row < start or row > end]
+        missing = [row for row in range(start, end + 1) if row not in self.item_widgets]
+
+        # Carga inicial o salto de scroll: congelar el viewport para que
+        # todos los rebind/show se pinten en una sola pasada
+        viewport = self.view.viewport()
+        batch = len(missing) > 1
+        if batch:
+            viewport.setUpdatesEnabled(False)
+        try:
+            # Devolver al pool los widgets que quedaron lejos del viewport
+            for row in stale:
+                item_widget = self.item_widgets.pop(row)
+                item_widget.hide()
+                self._free_widgets.append(item_widget)
+
+            for row in missing:
+                item_widget = self._bind_item_widget(row)
+                if item_widget is not None:
+                    self.item_widgets[row] = item_widget
+
+            for row, item_widget in self.item_widgets.items():
+                item_widget.setGeometry(self.view.visualRect(self.model.index(row)))
+                if item_widget.isHidden():
+                    item_widget.show()
+        finally:
+            if batch:
+                viewport.setUpdatesEnabled(True)
+
+    def _release_all_widgets(self):
+        """Hide every bound ItemButton and return it to the pool"""
+        for item_widget in self.item_widgets.values():
+            item_widget.hide()
+            self._free_widgets.append(item_widget)
         self.item_widgets.clear()
-        self.results.clear()
+
+    def _bind_item_widget(self, row):
+        """Get an ItemButton for a result row, reusing a pooled one if possible (None on error)"""
+        try:
+            item = self.model.item(row)
+
+            if self._free_widgets:
+                # Reutilizar: sin nuevos trackers ni reconexión de señales
+                item_widget = self._free_widgets.pop()
+                item_widget.rebind(item)
+                return item_widget
+
+            # Create item widget with category badge
+            item_widget = ItemButton(item, show_category=True, parent=self.view.viewport())
+            item_widget.item_clicked.connect(self._on_item_clicked)
+            item_widget.url_open_requested.connect(self._on_url_open_requested)
+            return item_widget
+
+        except Exception as e:
+            logger.error(f"Error creating item widget: {e}", exc_info=True)
+            return None
+
+    def clear_results(self):
+        """Clear all results"""
+        # Descartar un update pendiente para que no repinte tras limpiar
+        self._render_timer.stop()
+        self._pending_results = None
+        self._release_all_widgets()
+        # Reasignar (no .clear()): la lista pertenece a quien llamó update_results
+        self.results = []
+        self.model.set_results(self.results)
+        self.view.setVisible(False)
+        self.empty_label.setVisible(True)
 
     def _on_item_clicked(self, item):
         """Handle item click"""
@@ -902,6 +902,7 @@ class CategoryManagerWindow(QWidget):
                         "UPDATE categories SET color = ? WHERE id = ?",
                         (data['color'], category_id)
                     )
+                    self.db.invalidate_categories_cache()
 
                 logger.info(f"Category created: {data['name']} (ID: {category_id})")
 
@@ -1068,6 +1069,7 @@ class CategoryManagerWindow(QWidget):
                         "UPDATE categories SET color = ? WHERE id = ?",
                         (data['color'], new_category_id)
                     )
+                    self.db.invalidate_categories_cache()
 
                 logger.info(f"Category duplicated: {data['name']} (new ID: {new_category_id})")
 
@@ -1142,6 +1144,7 @@ class CategoryManagerWindow(QWidget):
                     "UPDATE categories SET is_pinned = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
                     (new_pinned, category_id)
                 )
+                self.db.invalidate_categories_cache()
                 logger.info(f"Category {category_id} pinned state changed to: {new_pinned}")
 
                 # Reload categories
@@ -4,8 +4,8 @@ Permite seleccionar categoría destino y configurar la lista
 """
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QLineEdit, QComboBox, QListWidget,
-                             QListWidgetItem, QCheckBox, QGroupBox)
-from PyQt6.QtCore import Qt, pyqtSignal
+                             QListWidgetItem, QCheckBox, QGroupBox, QListView)
+from PyQt6.QtCore import Qt, pyqtSignal, QSignalBlocker
 from PyQt6.QtGui import QFont
 import logging
 
@@ -75,12 +75,30 @@ class CreateListFromSearchDialog(QDialog):
 
         # Lista de items
         self.items_list = QListWidget()
-        for item in self.items:
-            category_info = f"[{item.category_name}]" if hasattr(item, 'category_name') else ""
-            list_item = QListWidgetItem(f"{category_info} {item.label}")
-            list_item.setData(Qt.ItemDataRole.UserRole, item.id)
-            list_item.setCheckState(Qt.CheckState.Checked)
-            self.items_list.addItem(list_item)
+        # Filas de una línea: sin medir cada fila, y maquetado por lotes
+        # para que cientos de items no bloqueen la apertura del diálogo
+        self.items_list.setUniformItemSizes(True)
+        self.items_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.items_list.setBatchSize(100)
+
+        # Poblar sin repintar ni emitir señales por cada item
+        self.items_list.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self.items_list)
+        try:
+            # Locales fuera del bucle: sin búsquedas de globals/atributos por item
+            add_item = self.items_list.addItem
+            user_role = Qt.ItemDataRole.UserRole
+            checked = Qt.CheckState.Checked
+            for item in self.items:
+                category_name = getattr(item, 'category_name', None)
+                prefix = f"[{category_name}] " if category_name else ""
+                list_item = QListWidgetItem(prefix + item.label)
+                list_item.setData(user_role, item.id)
+                list_item.setCheckState(checked)
+                add_item(list_item)
+        finally:
+            blocker.unblock()
+            self.items_list.setUpdatesEnabled(True)
 
         items_layout.addWidget(self.items_list)
         layout.addWidget(items_group)
@@ -162,8 +180,8 @@ class CreateListFromSearchDialog(QDialog):
         if not self.db_manager:
             return
 
-        # Obtener categorías desde DBManager
-        categories = self.db_manager.get_categories(include_inactive=False)
+        # Categorías cacheadas en DBManager: abrir el diálogo no consulta SQLite
+        categories = self.db_manager.get_categories_cached(include_inactive=False)
         for category in categories:
             self.category_combo.addItem(
                 f"{category['icon']} {category['name']}",
@@ -173,9 +191,17 @@ class CreateListFromSearchDialog(QDialog):
     def toggle_select_all(self, state):
         """Seleccionar/deseleccionar todos los items"""
         check_state = Qt.CheckState.Checked if state == Qt.CheckState.Checked.value else Qt.CheckState.Unchecked
-        for i in range(self.items_list.count()):
-            item = self.items_list.item(i)
-            item.setCheckState(check_state)
+
+        # Sin itemChanged ni repintado por fila: un solo repintado al final
+        self.items_list.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self.items_list)
+        try:
+            for i in range(self.items_list.count()):
+                self.items_list.item(i).setCheckState(check_state)
+        finally:
+            blocker.unblock()
+            self.items_list.setUpdatesEnabled(True)
+        self.items_list.viewport().update()
 
     def create_list(self):
         """Crear la lista con los items seleccionados"""
@@ -26,6 +26,20 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _restore_style_later(button: QWidget, style: str, msec: int) -> None:
+    """
+    Restaurar el stylesheet de un botón tras msec milisegundos
+
+    El timer es hijo del botón: si rebind() destruye el botón antes de que
+    venza, el timer se destruye con él y el callback nunca se ejecuta.
+    """
+    timer = QTimer(button)
+    timer.setSingleShot(True)
+    timer.timeout.connect(lambda: button.setStyleSheet(style))
+    timer.timeout.connect(timer.deleteLater)
+    timer.start(msec)
+
+
 class ItemButton(QFrame):
     """Custom item button widget for content panel with tags support"""
 
@@ -49,6 +63,9 @@ class ItemButton(QFrame):
         self.is_revealed = False  # Track if sensitive content is revealed
         self.reveal_timer = None  # Timer for auto-hide
         self.clipboard_clear_timer = None  # Timer for clipboard clearing
+        self.copied_timer = QTimer(self)  # Timer for copied feedback reset
+        self.copied_timer.setSingleShot(True)
+        self.copied_timer.timeout.connect(self.reset_style)
 
         # Usage tracking
         self.usage_tracker = UsageTracker()
@@ -506,6 +523,37 @@ class ItemButton(QFrame):
                 }
             """)
 
+    def rebind(self, item: Item):
+        """
+        Reuse this widget for another item (widget pools in virtualized views)
+
+        Rebuilds the visual content for the new item while keeping the usage
+        tracker, favorites manager and the signal connections made by the
+        container. The clipboard clear timer is intentionally left running.
+
+        Args:
+            item: Item to display
+        """
+        if self.reveal_timer:
+            self.reveal_timer.stop()
+            self.reveal_timer = None
+        self.copied_timer.stop()
+        self.is_copied = False
+        self.is_revealed = False
+        self.item = item
+
+        # Descartar layout (con sus sub-layouts de botones) e hijos actuales
+        old_layout = self.layout()
+        if old_layout is not None:
+            # Pasar el layout a un widget temporal para destruirlo ya
+            QWidget().setLayout(old_layout)
+        for child in self.findChildren(QWidget, options=Qt.FindChildOption.FindDirectChildrenOnly):
+            child.hide()
+            child.setParent(None)
+            child.deleteLater()
+
+        self.init_ui()
+
     def mousePressEvent(self, event):
         """Handle mouse press event"""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -566,7 +614,7 @@ class ItemButton(QFrame):
                         padding: 0px;
                     }
                 """)
-                QTimer.singleShot(300, lambda: self.open_url_button.setStyleSheet(original_style))
+                _restore_style_later(self.open_url_button, original_style, 300)
 
             except Exception as e:
                 logger.error(f"Error opening URL {self.item.label}: {e}")
@@ -610,7 +658,7 @@ class ItemButton(QFrame):
                         padding: 0px;
                     }
                 """)
-                QTimer.singleShot(300, lambda: self.open_external_button.setStyleSheet(original_style))
+                _restore_style_later(self.open_external_button, original_style, 300)
 
             except Exception as e:
                 logger.error(f"Error opening URL in system browser {self.item.label}: {e}")
@@ -676,7 +724,7 @@ class ItemButton(QFrame):
                         padding: 0px;
                     }
                 """)
-                QTimer.singleShot(300, lambda: self.open_explorer_button.setStyleSheet(original_style))
+                _restore_style_later(self.open_explorer_button, original_style, 300)
 
             except Exception as e:
                 logger.error(f"Error opening explorer for {self.item.label}: {e}")
@@ -721,7 +769,7 @@ class ItemButton(QFrame):
                         padding: 0px;
                     }
                 """)
-                QTimer.singleShot(300, lambda: self.open_file_button.setStyleSheet(original_style))
+                _restore_style_later(self.open_file_button, original_style, 300)
 
             except Exception as e:
                 print(f"Error opening file: {e}")
@@ -762,7 +810,7 @@ class ItemButton(QFrame):
             """)
 
         # Reset after 500ms
-        QTimer.singleShot(500, self.reset_style)
+        self.copied_timer.start(500)
 
     def reset_style(self):
         """Reset button style to normal"""
@@ -1184,7 +1232,7 @@ class ItemButton(QFrame):
                 error_msg = stderr if stderr else "Error desconocido"
 
             # Restaurar estilo original después de 1 segundo
-            QTimer.singleShot(1000, lambda: self.execute_button.setStyleSheet(original_style))
+            _restore_style_later(self.execute_button, original_style, 1000)
 
             # Mostrar dialog con el resultado
             dialog = CommandOutputDialog(
@@ -1212,7 +1260,7 @@ class ItemButton(QFrame):
                     padding: 0px;
                 }
             """)
-            QTimer.singleShot(1000, lambda: self.execute_button.setStyleSheet(original_style))
+            _restore_style_later(self.execute_button, original_style, 1000)
 
             # Mostrar dialog de error
             dialog = CommandOutputDialog(
@@ -1240,7 +1288,7 @@ class ItemButton(QFrame):
                     padding: 0px;
                 }
             """)
-            QTimer.singleShot(1000, lambda: self.execute_button.setStyleSheet(original_style))
+            _restore_style_later(self.execute_button, original_style, 1000)
 
             # Mostrar dialog de error
             dialog = CommandOutputDialog(
@@ -1287,7 +1335,7 @@ class ItemButton(QFrame):
             logger.info(f"WEB_STATIC render requested for item: {self.item.label}")
 
             # Restaurar estilo después de 300ms
-            QTimer.singleShot(300, lambda: self.render_button.setStyleSheet(original_style))
+            _restore_style_later(self.render_button, original_style, 300)
 
         except Exception as e:
             logger.error(f"Error rendering WEB_STATIC item {self.item.label}: {e}")
@@ -1304,7 +1352,7 @@ class ItemButton(QFrame):
                     padding: 0px;
                 }
             """)
-            QTimer.singleShot(1000, lambda: self.render_button.setStyleSheet(original_style))
+            _restore_style_later(self.render_button, original_style, 1000)
 
         finally:
             # Track execution end